@@ -8,10 +8,13 @@ Usage:
 
 import sys
 
+# First-argument values that select service/daemon mode
+_SERVICE_TOKENS = frozenset({"--service", "service"})
+
 
 def main() -> None:
     """Launch the GUI app or delegate to the service CLI."""
-    if len(sys.argv) > 1 and sys.argv[1] in ("--service", "service"):
+    if len(sys.argv) > 1 and sys.argv[1] in _SERVICE_TOKENS:
         from acb_sync.service import main as service_main
 
         service_main()
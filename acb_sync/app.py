@@ -8,23 +8,32 @@ Cross-platform: Windows, macOS, and Linux.
 
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 import threading
-from pathlib import Path
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from acb_sync import __app_name__, __version__
 from acb_sync.config import Config, get_log_path
-from acb_sync.copier import CopyRecord, FileCopier
+from acb_sync.filters import FileFilter
 from acb_sync.hotkeys import GlobalHotkeys
 from acb_sync.notify import notifier
 from acb_sync.platform_utils import (
+    is_autostart_registered,
     play_error_sound,
     register_autostart,
     unregister_autostart,
 )
 from acb_sync.tray import SysTray
-from acb_sync.ui import SettingsWindow, StatusWindow
-from acb_sync.watcher import FolderWatcher
+
+# The copy engine, watcher (watchdog) and windows are imported on first use
+# so they are not parsed before the tray appears.
+if TYPE_CHECKING:
+    from acb_sync.copier import CopyRecord, FileCopier
+    from acb_sync.ui import SettingsWindow, StatusWindow
+    from acb_sync.watcher import FolderWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +42,52 @@ _COLOR_ACTIVE = "#0A6E0A"  # green — sync running
 _COLOR_PAUSED = "#888888"  # grey  — sync paused
 _COLOR_ERROR = "#C4001A"  # red   — error / not configured
 
+# Shared by the file and stderr handlers
+_LOG_FORMATTER = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+
+class _SizeTrackingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that keeps a running size count in memory.
+
+    The stock handler seeks/stats the log file before every record to decide
+    whether to roll over.  This one reads the size once when the file is
+    opened and then adds the length of each written message.  Lengths are
+    counted in characters, so rollover is approximate for non-ASCII text.
+    """
+
+    def __init__(self, filename: str, **kwargs) -> None:
+        """Open *filename* and record its current size."""
+        super().__init__(filename, **kwargs)
+        try:
+            self._size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._size = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write *record*, rolling the file over first if it would overflow."""
+        try:
+            msg = self.format(record) + self.terminator
+            if (
+                self.maxBytes > 0
+                and self._size
+                and self._size + len(msg) >= self.maxBytes
+            ):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        """Rotate the log files and reset the size counter."""
+        super().doRollover()
+        self._size = 0
+
 
 class App:
     """Central orchestrator.
@@ -45,6 +100,12 @@ class App:
         self.config = Config()
         self.watcher: FolderWatcher | None = None
         self.copier: FileCopier | None = None
+        # (source, destination, subdirectories, max concurrent copies) the
+        # running sync was built for
+        self._sync_layout: tuple[str, str, bool, int] | None = None
+        # Every sync-related setting the running watcher/copier was given
+        self._applied_sync: tuple[Any, ...] | None = None
+        self._log_listener: logging.handlers.QueueListener | None = None
 
         # tkinter root — hidden, used only to drive the event loop
         import tkinter as tk
@@ -52,10 +113,16 @@ class App:
         self._root = tk.Tk()
         self._root.title(__app_name__)
         self._root.withdraw()  # Hide the root window
+        # Tk must only be touched from the thread that created the root
+        self._tk_thread_ident = threading.get_ident()
 
-        self._settings_win = SettingsWindow(self)
-        self._status_win = StatusWindow(self)
-        self._tray = SysTray(self)
+        # Windows are built lazily the first time they are opened
+        self._settings_win: SettingsWindow | None = None
+        self._status_win: StatusWindow | None = None
+        self._tray = SysTray(self, palette=(_COLOR_ACTIVE, _COLOR_PAUSED, _COLOR_ERROR))
+        # Last values pushed to the tray, so unchanged state is not re-sent
+        self._tray_color: str | None = None
+        self._tray_tooltip: str | None = None
 
         # Global hotkeys (all five user-configurable slots)
         cfg = self.config
@@ -71,6 +138,10 @@ class App:
             on_settings=self.on_open_settings,
             on_quit=self.on_quit,
         )
+        # Key combos currently bound, so unchanged settings skip re-hooking
+        self._applied_hotkeys = self._configured_hotkeys()
+        # Last autostart state applied (None = not yet applied this session)
+        self._applied_autostart: bool | None = None
 
         # Ensure clean shutdown on WM_DELETE_WINDOW of root
         self._root.protocol("WM_DELETE_WINDOW", self.on_quit)
@@ -122,34 +193,37 @@ class App:
             logger.warning("Cannot start sync: not configured.")
             return
 
+        from acb_sync.copier import FileCopier
+        from acb_sync.watcher import FolderWatcher
+
         try:
+            file_filter = self._file_filter()
             copier = FileCopier(
-                source_root=cfg.source_folder,
-                destination_root=cfg.destination_folder,
+                source_root=cfg.source_path,
+                destination_root=cfg.destination_path,
                 on_copy_complete=self._on_copy_complete,
                 preserve_structure=cfg.copy_subdirectories,
-                collision_mode=cfg.collision_mode,
-                rename_pattern=cfg.rename_pattern,
-                verify=cfg.verify_copies,
-                min_size=cfg.min_file_size,
-                max_size=cfg.max_file_size,
-                retry_count=cfg.retry_count,
-                retry_delay=cfg.retry_delay,
+                max_workers=cfg.max_concurrent_copies,
+                file_filter=file_filter,
+                **self._copier_options(),
             )
+            if self.copier is not None:
+                # Let copies already queued on the old copier drain in the
+                # background; it accepts no new work.
+                self.copier.shutdown(wait=False)
             self.copier = copier
             watcher = FolderWatcher(
-                source_folder=cfg.source_folder,
+                source_folder=cfg.source_path,
                 on_file_ready=copier.copy_file,
-                stable_seconds=cfg.stable_time,
-                extensions=cfg.file_extensions or None,
-                include_patterns=cfg.include_patterns or None,
-                exclude_patterns=cfg.exclude_patterns or None,
                 recursive=cfg.copy_subdirectories,
+                stable_seconds=cfg.stable_time,
+                file_filter=file_filter,
             )
             self.watcher = watcher
             watcher.start()
             cfg.sync_enabled = True
-            cfg.save()
+            self._sync_layout = self._configured_layout()
+            self._applied_sync = self._configured_sync()
             logger.info("Sync started.")
         except FileNotFoundError as exc:
             logger.error("Cannot start sync: %s", exc)
@@ -166,28 +240,95 @@ class App:
             self.watcher.stop()
             self.watcher = None
         self.config.sync_enabled = False
-        self.config.save()
         self._update_tray_state()
         logger.info("Sync stopped.")
 
     def restart_sync(self) -> None:
-        """Restart sync with current config (called after settings change)."""
-        self._stop_sync()
-        # Refresh hotkey bindings with potentially updated keys
+        """Restart sync with current config (called after settings change).
+
+        A running sync whose settings did not change is left untouched, so
+        hotkey, notification and startup edits cost nothing.  When the
+        source, destination, sub-folder mode and copy concurrency are
+        unchanged the running watcher and copier are reconfigured in place,
+        keeping the OS file-system watch alive.  Otherwise they are rebuilt.
+        """
         cfg = self.config
-        self._hotkeys.update_keys(
-            pause_resume_key=cfg.hotkey_pause_resume,
-            copy_now_key=cfg.hotkey_copy_now,
-            status_key=cfg.hotkey_status,
-            settings_key=cfg.hotkey_settings,
-            quit_key=cfg.hotkey_quit,
-        )
+        watcher, copier = self.watcher, self.copier
+        running = watcher is not None and copier is not None and watcher.is_running
+        sync_changed = True
+        if running and self._applied_sync == self._configured_sync():
+            sync_changed = False
+        elif (
+            watcher is not None
+            and copier is not None
+            and watcher.is_running
+            and self._sync_layout == self._configured_layout()
+        ):
+            file_filter = self._file_filter()
+            copier.reconfigure(file_filter=file_filter, **self._copier_options())
+            watcher.reconfigure(stable_seconds=cfg.stable_time, file_filter=file_filter)
+            self._applied_sync = self._configured_sync()
+            logger.info("Sync reconfigured.")
+        else:
+            self._stop_sync()
+            if cfg.is_configured():
+                cfg.sync_enabled = True
+                self._start_sync()
+        # Refresh hotkey bindings only if a combo actually changed
+        hotkeys = self._configured_hotkeys()
+        if hotkeys != self._applied_hotkeys:
+            self._hotkeys.update_keys(*hotkeys)
+            self._applied_hotkeys = hotkeys
         # Sync autostart with current setting
         self._sync_autostart()
-        if cfg.is_configured():
-            cfg.sync_enabled = True
-            self._start_sync()
-        notifier.speak("Settings saved. Sync restarted.")
+        cfg.mark_dirty()
+        if sync_changed:
+            notifier.speak("Settings saved. Sync restarted.")
+        else:
+            notifier.speak("Settings saved.")
+
+    def _configured_layout(self) -> tuple[str, str, bool, int]:
+        """Return the settings that require a full watcher/copier rebuild."""
+        cfg = self.config
+        return (
+            cfg.source_folder,
+            cfg.destination_folder,
+            cfg.copy_subdirectories,
+            cfg.max_concurrent_copies,
+        )
+
+    def _configured_sync(self) -> tuple[Any, ...]:
+        """Return every setting the watcher and copier are built from."""
+        cfg = self.config
+        return (
+            self._configured_layout(),
+            cfg.stable_time,
+            tuple(cfg.file_extensions),
+            tuple(cfg.include_patterns),
+            tuple(cfg.exclude_patterns),
+            self._copier_options(),
+        )
+
+    def _copier_options(self) -> dict[str, Any]:
+        """Return the ``FileCopier`` options that can change without a rebuild."""
+        cfg = self.config
+        return {
+            "collision_mode": cfg.collision_mode,
+            "rename_pattern": cfg.rename_pattern,
+            "verify": cfg.verify_copies,
+            "min_size": cfg.min_file_size,
+            "max_size": cfg.max_file_size,
+            "retry_count": cfg.retry_count,
+            "retry_delay": cfg.retry_delay,
+            "checksum_algo": cfg.checksum_algo,
+        }
+
+    def _file_filter(self) -> FileFilter:
+        """Compile the configured extension and glob filters."""
+        cfg = self.config
+        return FileFilter(
+            cfg.file_extensions, cfg.include_patterns, cfg.exclude_patterns
+        )
 
     # ------------------------------------------------------------------
     # TrayCallbacks implementation
@@ -195,11 +336,11 @@ class App:
 
     def on_open_status(self) -> None:
         """Show the status window (thread-safe)."""
-        self._root.after(0, self._status_win.show)
+        self._call_on_tk_thread(self._show_status)
 
     def on_open_settings(self) -> None:
         """Show the settings window (thread-safe)."""
-        self._root.after(0, self._settings_win.show)
+        self._call_on_tk_thread(self._show_settings)
 
     def on_toggle_sync(self) -> None:
         """Pause or resume sync."""
@@ -209,7 +350,7 @@ class App:
         else:
             self._start_sync()
             notifier.speak("Sync resumed.")
-        self._tray.refresh_menu()
+        self.config.mark_dirty()
 
     def on_copy_now(self) -> None:
         """Trigger an immediate copy of all pending stable files."""
@@ -235,10 +376,19 @@ class App:
         logger.info("Shutting down\u2026")
         self._hotkeys.unregister()
         self._stop_sync()
+        if self.copier is not None:
+            # Running copies finish before the interpreter exits; queued
+            # ones are dropped (use "Copy now" after restart to catch up).
+            self.copier.shutdown(wait=False, cancel_pending=True)
         self._tray.stop()
+        self.config.save()
         notifier.speak(f"{__app_name__} closing.")
         self._root.quit()
         self._root.destroy()
+        if self._log_listener is not None:
+            # Drain queued records to the file before exit
+            self._log_listener.stop()
+            self._log_listener = None
 
     def is_sync_enabled(self) -> bool:
         """Return whether sync is currently enabled."""
@@ -263,68 +413,144 @@ class App:
     # Internals
     # ------------------------------------------------------------------
 
-    def _on_copy_complete(self, rec: CopyRecord) -> None:
+    def _call_on_tk_thread(self, func: Callable[[], None]) -> None:
+        """Run *func* now if already on the tk thread, else post it to the loop."""
+        if threading.get_ident() == self._tk_thread_ident:
+            func()
+        else:
+            self._root.after(0, func)
+
+    def _show_status(self) -> None:
+        """Build the status window on first use, then show it (tk thread)."""
+        if self._status_win is None:
+            from acb_sync.ui import StatusWindow
+
+            self._status_win = StatusWindow(self)
+        self._status_win.show()
+
+    def _show_settings(self) -> None:
+        """Build the settings window on first use, then show it (tk thread)."""
+        if self._settings_win is None:
+            from acb_sync.ui import SettingsWindow
+
+            self._settings_win = SettingsWindow(self)
+        self._settings_win.show()
+
+    def _on_copy_complete(self, rec: "CopyRecord") -> None:
         """Handle completion of a single file copy."""
-        name = Path(rec.destination).name if rec.destination else "unknown"
+        name = os.path.basename(rec.destination) if rec.destination else "unknown"
         if rec.skipped:
-            self._tray.update_tooltip(f"Skipped: {name}")
+            self._set_tray_tooltip(f"Skipped: {name}")
             notifier.speak(f"Skipped {name}.")
         elif rec.success:
             suffix = " (verified)" if rec.verified else ""
-            self._tray.update_tooltip(f"Copied: {name}{suffix}")
+            self._set_tray_tooltip(f"Copied: {name}{suffix}")
             notifier.speak(f"Copied {name}{suffix}.")
         else:
             short_err = (rec.error or "unknown error")[:60]
-            self._tray.update_tooltip(f"Copy failed: {short_err}")
+            self._set_tray_tooltip(f"Copy failed: {short_err}")
             notifier.speak(f"Copy failed: {short_err}.")
             # Play error sound if enabled
             if self.config.play_sound_on_error:
                 play_error_sound()
-        self._tray.refresh_menu()
+        self._tray.push_status(self.config.sync_enabled, self.get_status_summary())
+        # Show the new record now rather than on the next periodic tick
+        status_win = self._status_win
+        if status_win is not None:
+            self._call_on_tk_thread(status_win.request_refresh)
 
     def _update_tray_state(self) -> None:
         """Update tray icon colour and tooltip to reflect current state."""
         cfg = self.config
         summary = self.get_status_summary()
         if not cfg.is_configured():
-            self._tray.update_icon_color(_COLOR_ERROR)
+            color = _COLOR_ERROR
         elif cfg.sync_enabled:
-            self._tray.update_icon_color(_COLOR_ACTIVE)
+            color = _COLOR_ACTIVE
         else:
-            self._tray.update_icon_color(_COLOR_PAUSED)
-        self._tray.update_tooltip(f"Stream Watcher \u2014 {summary}")
-        self._tray.refresh_menu()
+            color = _COLOR_PAUSED
+        if color != self._tray_color:
+            self._tray_color = color
+            self._tray.update_icon_color(color)
+        self._set_tray_tooltip(f"Stream Watcher \u2014 {summary}")
+        self._tray.push_status(cfg.sync_enabled, summary)
+
+    def _set_tray_tooltip(self, text: str) -> None:
+        """Update the tray tooltip unless it already shows *text*."""
+        if text != self._tray_tooltip:
+            self._tray_tooltip = text
+            self._tray.update_tooltip(text)
+
+    def _configured_hotkeys(self) -> tuple[str, str, str, str, str]:
+        """Return the five hotkey combos in ``GlobalHotkeys.update_keys`` order."""
+        cfg = self.config
+        return (
+            cfg.hotkey_pause_resume,
+            cfg.hotkey_copy_now,
+            cfg.hotkey_status,
+            cfg.hotkey_settings,
+            cfg.hotkey_quit,
+        )
 
     def _sync_autostart(self) -> None:
         """Register or unregister autostart based on config."""
-        if self.config.start_with_windows:
-            register_autostart()
-        else:
-            unregister_autostart()
+        desired = self.config.start_with_windows
+        if desired == self._applied_autostart:
+            return
+        if desired and is_autostart_registered():
+            # Entry already matches this install — nothing to write.  A
+            # stale entry also reads as "not registered", so disabling
+            # always goes through unregister_autostart().
+            self._applied_autostart = desired
+            return
+        ok = register_autostart() if desired else unregister_autostart()
+        if ok:
+            self._applied_autostart = desired
 
     def _setup_logging(self) -> None:
-        """Configure rotating file log and stderr handler."""
+        """Configure rotating file log and stderr handler.
+
+        Both handlers run on a ``QueueListener`` thread; the root logger only
+        gets a ``QueueHandler`` so logging calls from the tk and copy threads
+        never block on disk or console I/O.
+
+        Safe to call again: handlers from a previous call are removed and
+        closed first so records are never written twice.
+        """
         log_path = get_log_path()
         level = getattr(logging, self.config.log_level.upper(), logging.INFO)
         root_logger = logging.getLogger()
         root_logger.setLevel(level)
 
-        fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            for handler in self._log_listener.handlers:
+                handler.close()
+            self._log_listener = None
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+            handler.close()
 
         # Rotating file handler
         max_bytes = self.config.max_log_size_mb * 1024 * 1024
-        fh = logging.handlers.RotatingFileHandler(
+        fh = _SizeTrackingRotatingFileHandler(
             str(log_path),
             maxBytes=max_bytes,
             backupCount=self.config.log_backup_count,
             encoding="utf-8",
         )
         fh.setLevel(level)
-        fh.setFormatter(fmt)
-        root_logger.addHandler(fh)
+        fh.setFormatter(_LOG_FORMATTER)
 
         # Stderr handler (for development)
         sh = logging.StreamHandler(sys.stderr)
         sh.setLevel(level)
-        sh.setFormatter(fmt)
-        root_logger.addHandler(sh)
+        sh.setFormatter(_LOG_FORMATTER)
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(
+            log_queue, fh, sh, respect_handler_level=True
+        )
+        listener.start()
+        self._log_listener = listener
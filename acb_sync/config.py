@@ -4,8 +4,15 @@ Stores and retrieves user settings from a JSON config file
 in the platform-appropriate application data directory.
 """
 
+import contextlib
+import copy
+import functools
 import json
 import logging
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
@@ -18,11 +25,23 @@ from acb_sync.platform_utils import (
 
 logger = logging.getLogger(__name__)
 
+# ---- optional fast JSON backend ----
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # Collision resolution strategies
 COLLISION_OVERWRITE = "overwrite"
 COLLISION_RENAME = "rename"
 COLLISION_SKIP = "skip"
 
+# Copy verification checksum algorithms
+CHECKSUM_BLAKE3 = "blake3"
+CHECKSUM_SHA256 = "sha256"
+
 # Available tokens for the rename pattern
 # {name}     — original filename without extension
 # {ext}      — original extension (without dot)
@@ -37,42 +56,138 @@ RENAME_PATTERN_HELP = (
 )
 DEFAULT_RENAME_PATTERN = "{name}_{n}.{ext}"
 
-DEFAULT_CONFIG: dict[str, Any] = {
-    "source_folder": "",
-    "destination_folder": "",
-    "check_interval_seconds": 30,
-    "stable_time_seconds": 60,
-    "file_extensions": [],  # Empty = all files
-    "include_patterns": [],  # Glob patterns to include (e.g. ["ACB_*", "*_stream_*"])
-    "exclude_patterns": [],  # Glob patterns to exclude (e.g. ["*.tmp", "~*"])
-    "sync_enabled": True,
-    "copy_subdirectories": False,
-    "log_level": "INFO",
-    "start_minimized": True,
-    "start_with_windows": False,
+# Seconds to wait after the last mark_dirty() before writing to disk
+_FLUSH_DELAY = 0.5
+
+
+def _at_least(low: int) -> Callable[[Any], int]:
+    return lambda value: max(low, int(value))
+
+
+def _one_of(*choices: str) -> Callable[[Any], str]:
+    # The first choice doubles as the fallback for unknown values
+    return lambda value: value if value in choices else choices[0]
+
+
+def _hotkey(value: Any) -> str:
+    return str(value).strip().lower()
+
+
+def _stripped_list(value: Any) -> list[str]:
+    return [str(p).strip() for p in value if str(p).strip()]
+
+
+def _extension_list(value: Any) -> list[str]:
+    return [e.lower().lstrip(".") for e in _stripped_list(value)]
+
+
+# Range / choice rules for each setting, applied both when a value is set
+# through ``Config`` and when config.json is loaded.  Fields not listed
+# accept any value of their declared type.
+_NORMALISERS: dict[str, Callable[[Any], Any]] = {
+    "check_interval_seconds": _at_least(5),
+    "stable_time_seconds": _at_least(0),
+    "file_extensions": _extension_list,
+    "include_patterns": _stripped_list,
+    "exclude_patterns": _stripped_list,
+    "collision_mode": _one_of(COLLISION_RENAME, COLLISION_OVERWRITE, COLLISION_SKIP),
+    "rename_pattern": lambda value: value.strip() or DEFAULT_RENAME_PATTERN,
+    "checksum_algo": _one_of(CHECKSUM_BLAKE3, CHECKSUM_SHA256),
+    "min_file_size_bytes": _at_least(0),
+    "max_file_size_bytes": _at_least(0),
+    "retry_count": _at_least(0),
+    "retry_delay_seconds": _at_least(1),
+    "max_concurrent_copies": lambda value: min(16, max(1, int(value))),
+    "max_log_size_mb": _at_least(1),
+    "log_backup_count": _at_least(0),
+    "hotkey_pause_resume": _hotkey,
+    "hotkey_copy_now": _hotkey,
+    "hotkey_status": _hotkey,
+    "hotkey_settings": _hotkey,
+    "hotkey_quit": _hotkey,
+}
+
+
+@dataclass(slots=True)
+class ConfigData:
+    """Typed storage for every persisted setting.
+
+    Field names match the JSON keys in ``config.json``.  Values read from
+    disk are coerced to the declared field type in ``__post_init__`` so the
+    ``Config`` accessors can return them without re-converting.
+    """
+
+    source_folder: str = ""
+    destination_folder: str = ""
+    check_interval_seconds: int = 30
+    stable_time_seconds: int = 60
+    file_extensions: list[str] = field(default_factory=list)  # Empty = all files
+    # Glob patterns to include (e.g. ["ACB_*", "*_stream_*"])
+    include_patterns: list[str] = field(default_factory=list)
+    # Glob patterns to exclude (e.g. ["*.tmp", "~*"])
+    exclude_patterns: list[str] = field(default_factory=list)
+    sync_enabled: bool = True
+    copy_subdirectories: bool = False
+    log_level: str = "INFO"
+    start_minimized: bool = True
+    start_with_windows: bool = False
     # ---- collision protection ----
-    "collision_mode": COLLISION_RENAME,  # overwrite | rename | skip
-    "rename_pattern": DEFAULT_RENAME_PATTERN,
+    collision_mode: str = COLLISION_RENAME  # overwrite | rename | skip
+    rename_pattern: str = DEFAULT_RENAME_PATTERN
     # ---- verification ----
-    "verify_copies": True,  # SHA-256 checksum after copy
+    verify_copies: bool = True  # checksum source and destination after copy
+    checksum_algo: str = CHECKSUM_BLAKE3  # blake3 | sha256
     # ---- gating ----
-    "min_file_size_bytes": 0,  # skip files smaller than this (0 = no minimum)
-    "max_file_size_bytes": 0,  # skip files larger than this (0 = no maximum)
+    min_file_size_bytes: int = 0  # skip files smaller than this (0 = no minimum)
+    max_file_size_bytes: int = 0  # skip files larger than this (0 = no maximum)
     # ---- retry ----
-    "retry_count": 2,  # number of retries on failed copy (0 = no retries)
-    "retry_delay_seconds": 5,  # seconds between retries
+    retry_count: int = 2  # number of retries on failed copy (0 = no retries)
+    retry_delay_seconds: int = 5  # seconds between retries
+    # ---- concurrency ----
+    max_concurrent_copies: int = 4  # files copied at the same time
     # ---- notifications ----
-    "play_sound_on_error": True,  # system alert sound on copy failure
+    play_sound_on_error: bool = True  # system alert sound on copy failure
     # ---- log rotation ----
-    "max_log_size_mb": 10,  # rotate log when it exceeds this size
-    "log_backup_count": 3,  # number of rotated log files to keep
+    max_log_size_mb: int = 10  # rotate log when it exceeds this size
+    log_backup_count: int = 3  # number of rotated log files to keep
     # ---- global hotkeys (all user-configurable) ----
-    "hotkey_pause_resume": "ctrl+shift+f9",
-    "hotkey_copy_now": "ctrl+shift+f10",
-    "hotkey_status": "ctrl+shift+f11",
-    "hotkey_settings": "ctrl+shift+f12",
-    "hotkey_quit": "",  # blank = no hotkey assigned
-}
+    hotkey_pause_resume: str = "ctrl+shift+f9"
+    hotkey_copy_now: str = "ctrl+shift+f10"
+    hotkey_status: str = "ctrl+shift+f11"
+    hotkey_settings: str = "ctrl+shift+f12"
+    hotkey_quit: str = ""  # blank = no hotkey assigned
+
+    def __post_init__(self) -> None:
+        """Coerce and normalise loaded values, falling back to defaults."""
+        for f in fields(self):
+            value = getattr(self, f.name)
+            try:
+                if f.type is bool:
+                    value = bool(value)
+                elif f.type is int:
+                    value = int(value)
+                elif f.type is str:
+                    value = str(value)
+                elif not isinstance(value, list):
+                    raise TypeError(f"expected a list, got {type(value).__name__}")
+                normalise = _NORMALISERS.get(f.name)
+                if normalise is not None:
+                    value = normalise(value)
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Invalid value for %s: %r; using default.", f.name, value
+                )
+                value = getattr(_DEFAULTS, f.name)
+                if isinstance(value, list):
+                    value = list(value)
+            setattr(self, f.name, value)
+
+
+_DEFAULTS = ConfigData()
+# Every key ConfigData knows about — anything else in config.json is dropped
+_FIELD_NAMES = frozenset(f.name for f in fields(ConfigData))
+
+DEFAULT_CONFIG: dict[str, Any] = asdict(_DEFAULTS)
 
 
 def get_config_dir() -> Path:
@@ -80,6 +195,7 @@ def get_config_dir() -> Path:
     return _platform_config_dir()
 
 
+@functools.cache
 def get_config_path() -> Path:
     """Return the path to the configuration file."""
     return get_config_dir() / "config.json"
@@ -96,331 +212,454 @@ class Config:
     def __init__(self, path: Path | None = None):
         """Load config from *path*, falling back to the platform default."""
         self._path = path or get_config_path()
-        self._data: dict[str, Any] = dict(DEFAULT_CONFIG)
+        self._d = ConfigData()
+        # (folder string, Path) pairs backing source_path / destination_path
+        self._source_path: tuple[str, Path] | None = None
+        self._destination_path: tuple[str, Path] | None = None
+        # Snapshot of what is on disk — lets save() skip no-op writes
+        self._saved: ConfigData | None = None
+        # Debounced write-behind state (see mark_dirty / flush_now)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer: threading.Timer | None = None
         self.load()
 
     # ---- persistence ----
 
     def load(self) -> None:
         """Load configuration from disk, applying defaults for missing keys."""
-        if self._path.exists():
-            try:
+        try:
+            if _HAS_ORJSON:
+                stored = orjson.loads(self._path.read_bytes())
+            else:
                 with open(self._path, encoding="utf-8") as fh:
                     stored = json.load(fh)
-                # Merge stored values over defaults so new keys get defaults
-                self._data = {**DEFAULT_CONFIG, **stored}
-                logger.info("Configuration loaded from %s", self._path)
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning("Could not read config (%s); using defaults.", exc)
-                self._data = dict(DEFAULT_CONFIG)
-        else:
-            self._data = dict(DEFAULT_CONFIG)
-            self.save()
-            logger.info("Created default configuration at %s", self._path)
+            if not isinstance(stored, dict):
+                raise TypeError("top-level JSON value is not an object")
+            unknown = stored.keys() - _FIELD_NAMES
+            if unknown:
+                logger.warning(
+                    "Ignoring unknown config keys: %s", ", ".join(sorted(unknown))
+                )
+            # Missing keys keep their dataclass defaults
+            self._d = ConfigData(**{k: stored[k] for k in stored.keys() & _FIELD_NAMES})
+            self._saved = copy.deepcopy(self._d)
+            logger.info("Configuration loaded from %s", self._path)
+        except FileNotFoundError:
+            self._d = ConfigData()
+            with self._lock:
+                created = self._write()
+            if created:
+                logger.info("Created default configuration at %s", self._path)
+        except (json.JSONDecodeError, OSError, TypeError) as exc:
+            logger.warning("Could not read config (%s); using defaults.", exc)
+            self._d = ConfigData()
+            self._saved = None
 
     def save(self) -> None:
-        """Persist the current configuration to disk."""
+        """Persist the current configuration to disk immediately.
+
+        Nothing is written if the settings are unchanged since the last
+        load or save.
+        """
+        with self._lock:
+            self._cancel_flush()
+            self._dirty = False
+            self._write()
+
+    def mark_dirty(self) -> None:
+        """Schedule a debounced save.
+
+        Repeated calls within ``_FLUSH_DELAY`` seconds collapse into a
+        single write performed on a background timer thread.
+        """
+        with self._lock:
+            self._dirty = True
+            self._cancel_flush()
+            timer = threading.Timer(_FLUSH_DELAY, self._flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def flush_now(self) -> None:
+        """Write any pending debounced changes to disk right away."""
+        with self._lock:
+            self._cancel_flush()
+            if self._dirty:
+                self._dirty = False
+                self._write()
+
+    def _flush(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            if self._dirty:
+                self._dirty = False
+                self._write()
+
+    def _cancel_flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _write(self) -> bool:
+        """Serialise the configuration to disk (caller holds ``_lock``).
+
+        Writes to a temporary sibling file, fsyncs it and swaps it into
+        place with ``os.replace`` so a crash mid-write never leaves a
+        truncated config.  Skipped when nothing changed since the last
+        load or write.  Returns True only if the file was written.
+        """
+        if self._d == self._saved:
+            logger.debug("Configuration unchanged; not saving.")
+            return False
+        tmp = self._path.with_suffix(".json.tmp")
         try:
             self._path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._path, "w", encoding="utf-8") as fh:
-                json.dump(self._data, fh, indent=2)
+            if _HAS_ORJSON:
+                payload = orjson.dumps(asdict(self._d), option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(asdict(self._d), indent=2).encode("utf-8")
+            with open(tmp, "wb") as fh:
+                fh.write(payload)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp, self._path)
+            self._saved = copy.deepcopy(self._d)
             logger.info("Configuration saved.")
+            return True
         except OSError as exc:
             logger.error("Failed to save configuration: %s", exc)
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
+            return False
 
     # ---- accessors ----
 
     @property
     def source_folder(self) -> str:
         """Return the watched source folder path."""
-        return self._data["source_folder"]
+        return self._d.source_folder
 
     @source_folder.setter
     def source_folder(self, value: str) -> None:
         """Set the watched source folder path."""
-        self._data["source_folder"] = value
+        self._d.source_folder = value
 
     @property
     def destination_folder(self) -> str:
         """Return the copy-destination folder path."""
-        return self._data["destination_folder"]
+        return self._d.destination_folder
 
     @destination_folder.setter
     def destination_folder(self, value: str) -> None:
         """Set the copy-destination folder path."""
-        self._data["destination_folder"] = value
+        self._d.destination_folder = value
+
+    @property
+    def source_path(self) -> Path:
+        """Return the source folder as a ``Path``, rebuilt only when it changes."""
+        folder = self._d.source_folder
+        if self._source_path is None or self._source_path[0] is not folder:
+            self._source_path = (folder, Path(folder))
+        return self._source_path[1]
+
+    @property
+    def destination_path(self) -> Path:
+        """Return the destination folder as a ``Path``, rebuilt only when it changes."""
+        folder = self._d.destination_folder
+        if self._destination_path is None or self._destination_path[0] is not folder:
+            self._destination_path = (folder, Path(folder))
+        return self._destination_path[1]
 
     @property
     def check_interval(self) -> int:
         """Return the poll interval in seconds."""
-        return int(self._data["check_interval_seconds"])
+        return self._d.check_interval_seconds
 
     @check_interval.setter
     def check_interval(self, value: int) -> None:
         """Set the poll interval (minimum 5 s)."""
-        self._data["check_interval_seconds"] = max(5, int(value))
+        self._d.check_interval_seconds = _NORMALISERS["check_interval_seconds"](value)
 
     @property
     def stable_time(self) -> int:
         """Return the stability threshold in seconds."""
-        return int(self._data["stable_time_seconds"])
+        return self._d.stable_time_seconds
 
     @stable_time.setter
     def stable_time(self, value: int) -> None:
         """Set the stability threshold (minimum 0 s)."""
-        self._data["stable_time_seconds"] = max(0, int(value))
+        self._d.stable_time_seconds = _NORMALISERS["stable_time_seconds"](value)
 
     @property
     def file_extensions(self) -> list[str]:
         """Return the list of allowed file extensions."""
-        return self._data["file_extensions"]
+        return self._d.file_extensions
 
     @file_extensions.setter
     def file_extensions(self, value: list[str]) -> None:
         """Set allowed file extensions, normalising to lowercase."""
-        self._data["file_extensions"] = [
-            ext.lower().strip().lstrip(".") for ext in value if ext.strip()
-        ]
+        self._d.file_extensions = _NORMALISERS["file_extensions"](value)
 
     @property
     def sync_enabled(self) -> bool:
         """Return whether automatic sync is enabled."""
-        return bool(self._data["sync_enabled"])
+        return self._d.sync_enabled
 
     @sync_enabled.setter
     def sync_enabled(self, value: bool) -> None:
         """Enable or disable automatic sync."""
-        self._data["sync_enabled"] = value
+        self._d.sync_enabled = value
 
     @property
     def copy_subdirectories(self) -> bool:
         """Return whether sub-folder structure is replicated."""
-        return bool(self._data["copy_subdirectories"])
+        return self._d.copy_subdirectories
 
     @copy_subdirectories.setter
     def copy_subdirectories(self, value: bool) -> None:
         """Set whether sub-folder structure is replicated."""
-        self._data["copy_subdirectories"] = value
+        self._d.copy_subdirectories = value
 
     @property
     def start_minimized(self) -> bool:
         """Return whether the app starts minimised to the tray."""
-        return bool(self._data["start_minimized"])
+        return self._d.start_minimized
 
     @start_minimized.setter
     def start_minimized(self, value: bool) -> None:
         """Set whether the app starts minimised to the tray."""
-        self._data["start_minimized"] = value
+        self._d.start_minimized = value
 
     @property
     def start_with_windows(self) -> bool:
         """Return whether auto-start at login is enabled."""
-        return bool(self._data["start_with_windows"])
+        return self._d.start_with_windows
 
     @start_with_windows.setter
     def start_with_windows(self, value: bool) -> None:
         """Enable or disable auto-start at login."""
-        self._data["start_with_windows"] = value
+        self._d.start_with_windows = value
 
     @property
     def log_level(self) -> str:
         """Return the current logging level name."""
-        return self._data.get("log_level", "INFO")
+        return self._d.log_level
 
     @log_level.setter
     def log_level(self, value: str) -> None:
         """Set the logging level name."""
-        self._data["log_level"] = value
+        self._d.log_level = value
 
     # ---- collision protection ----
 
     @property
     def collision_mode(self) -> str:
         """Return the collision resolution strategy."""
-        return self._data.get("collision_mode", COLLISION_RENAME)
+        return self._d.collision_mode
 
     @collision_mode.setter
     def collision_mode(self, value: str) -> None:
         """Set the collision resolution strategy."""
-        if value not in (COLLISION_OVERWRITE, COLLISION_RENAME, COLLISION_SKIP):
-            value = COLLISION_RENAME
-        self._data["collision_mode"] = value
+        self._d.collision_mode = _NORMALISERS["collision_mode"](value)
 
     @property
     def rename_pattern(self) -> str:
         """Return the token-based rename pattern."""
-        return self._data.get("rename_pattern", DEFAULT_RENAME_PATTERN)
+        return self._d.rename_pattern
 
     @rename_pattern.setter
     def rename_pattern(self, value: str) -> None:
         """Set the token-based rename pattern."""
-        self._data["rename_pattern"] = value.strip() or DEFAULT_RENAME_PATTERN
+        self._d.rename_pattern = _NORMALISERS["rename_pattern"](value)
 
     # ---- verification ----
 
     @property
     def verify_copies(self) -> bool:
-        """Return whether SHA-256 verification is enabled."""
-        return bool(self._data.get("verify_copies", True))
+        """Return whether checksum verification of copies is enabled."""
+        return self._d.verify_copies
 
     @verify_copies.setter
     def verify_copies(self, value: bool) -> None:
-        """Enable or disable SHA-256 copy verification."""
-        self._data["verify_copies"] = value
+        """Enable or disable checksum verification of copies."""
+        self._d.verify_copies = value
+
+    @property
+    def checksum_algo(self) -> str:
+        """Return the checksum algorithm used for copy verification."""
+        return self._d.checksum_algo
+
+    @checksum_algo.setter
+    def checksum_algo(self, value: str) -> None:
+        """Set the checksum algorithm (``"blake3"`` or ``"sha256"``)."""
+        self._d.checksum_algo = _NORMALISERS["checksum_algo"](value)
 
     # ---- gating ----
 
     @property
     def min_file_size(self) -> int:
         """Return the minimum file size in bytes (0 = none)."""
-        return int(self._data.get("min_file_size_bytes", 0))
+        return self._d.min_file_size_bytes
 
     @min_file_size.setter
     def min_file_size(self, value: int) -> None:
         """Set the minimum file size gate."""
-        self._data["min_file_size_bytes"] = max(0, int(value))
+        self._d.min_file_size_bytes = _NORMALISERS["min_file_size_bytes"](value)
 
     @property
     def max_file_size(self) -> int:
         """Return the maximum file size in bytes (0 = none)."""
-        return int(self._data.get("max_file_size_bytes", 0))
+        return self._d.max_file_size_bytes
 
     @max_file_size.setter
     def max_file_size(self, value: int) -> None:
         """Set the maximum file size gate."""
-        self._data["max_file_size_bytes"] = max(0, int(value))
+        self._d.max_file_size_bytes = _NORMALISERS["max_file_size_bytes"](value)
 
     # ---- global hotkeys ----
 
     @property
     def hotkey_pause_resume(self) -> str:
         """Return the pause/resume hotkey combo."""
-        return self._data.get("hotkey_pause_resume", "ctrl+shift+f9")
+        return self._d.hotkey_pause_resume
 
     @hotkey_pause_resume.setter
     def hotkey_pause_resume(self, value: str) -> None:
         """Set the pause/resume hotkey combo."""
-        self._data["hotkey_pause_resume"] = value.strip().lower()
+        self._d.hotkey_pause_resume = _NORMALISERS["hotkey_pause_resume"](value)
 
     @property
     def hotkey_copy_now(self) -> str:
         """Return the copy-now hotkey combo."""
-        return self._data.get("hotkey_copy_now", "ctrl+shift+f10")
+        return self._d.hotkey_copy_now
 
     @hotkey_copy_now.setter
     def hotkey_copy_now(self, value: str) -> None:
         """Set the copy-now hotkey combo."""
-        self._data["hotkey_copy_now"] = value.strip().lower()
+        self._d.hotkey_copy_now = _NORMALISERS["hotkey_copy_now"](value)
 
     @property
     def hotkey_status(self) -> str:
         """Return the status-window hotkey combo."""
-        return self._data.get("hotkey_status", "ctrl+shift+f11")
+        return self._d.hotkey_status
 
     @hotkey_status.setter
     def hotkey_status(self, value: str) -> None:
         """Set the status-window hotkey combo."""
-        self._data["hotkey_status"] = value.strip().lower()
+        self._d.hotkey_status = _NORMALISERS["hotkey_status"](value)
 
     @property
     def hotkey_settings(self) -> str:
         """Return the settings-window hotkey combo."""
-        return self._data.get("hotkey_settings", "ctrl+shift+f12")
+        return self._d.hotkey_settings
 
     @hotkey_settings.setter
     def hotkey_settings(self, value: str) -> None:
         """Set the settings-window hotkey combo."""
-        self._data["hotkey_settings"] = value.strip().lower()
+        self._d.hotkey_settings = _NORMALISERS["hotkey_settings"](value)
 
     @property
     def hotkey_quit(self) -> str:
         """Return the quit hotkey combo."""
-        return self._data.get("hotkey_quit", "")
+        return self._d.hotkey_quit
 
     @hotkey_quit.setter
     def hotkey_quit(self, value: str) -> None:
         """Set the quit hotkey combo."""
-        self._data["hotkey_quit"] = value.strip().lower()
+        self._d.hotkey_quit = _NORMALISERS["hotkey_quit"](value)
 
     # ---- include patterns ----
 
     @property
     def include_patterns(self) -> list[str]:
         """Glob patterns files must match to be watched (empty = all files)."""
-        return self._data.get("include_patterns", [])
+        return self._d.include_patterns
 
     @include_patterns.setter
     def include_patterns(self, value: list[str]) -> None:
         """Set glob patterns files must match."""
-        self._data["include_patterns"] = [p.strip() for p in value if p.strip()]
+        self._d.include_patterns = _NORMALISERS["include_patterns"](value)
 
     # ---- exclude patterns ----
 
     @property
     def exclude_patterns(self) -> list[str]:
         """Return glob patterns used to skip files."""
-        return self._data.get("exclude_patterns", [])
+        return self._d.exclude_patterns
 
     @exclude_patterns.setter
     def exclude_patterns(self, value: list[str]) -> None:
         """Set glob patterns used to skip files."""
-        self._data["exclude_patterns"] = [p.strip() for p in value if p.strip()]
+        self._d.exclude_patterns = _NORMALISERS["exclude_patterns"](value)
 
     # ---- retry ----
 
     @property
     def retry_count(self) -> int:
         """Return the number of copy retry attempts."""
-        return int(self._data.get("retry_count", 2))
+        return self._d.retry_count
 
     @retry_count.setter
     def retry_count(self, value: int) -> None:
         """Set the number of copy retry attempts."""
-        self._data["retry_count"] = max(0, int(value))
+        self._d.retry_count = _NORMALISERS["retry_count"](value)
 
     @property
     def retry_delay(self) -> int:
         """Return seconds between retry attempts."""
-        return int(self._data.get("retry_delay_seconds", 5))
+        return self._d.retry_delay_seconds
 
     @retry_delay.setter
     def retry_delay(self, value: int) -> None:
         """Set seconds between retry attempts (minimum 1)."""
-        self._data["retry_delay_seconds"] = max(1, int(value))
+        self._d.retry_delay_seconds = _NORMALISERS["retry_delay_seconds"](value)
+
+    # ---- concurrency ----
+
+    @property
+    def max_concurrent_copies(self) -> int:
+        """Return the maximum number of simultaneous copies."""
+        return self._d.max_concurrent_copies
+
+    @max_concurrent_copies.setter
+    def max_concurrent_copies(self, value: int) -> None:
+        """Set the maximum number of simultaneous copies (1-16)."""
+        self._d.max_concurrent_copies = _NORMALISERS["max_concurrent_copies"](value)
 
     # ---- notifications ----
 
     @property
     def play_sound_on_error(self) -> bool:
         """Return whether an alert sound plays on failure."""
-        return bool(self._data.get("play_sound_on_error", True))
+        return self._d.play_sound_on_error
 
     @play_sound_on_error.setter
     def play_sound_on_error(self, value: bool) -> None:
         """Enable or disable the error alert sound."""
-        self._data["play_sound_on_error"] = value
+        self._d.play_sound_on_error = value
 
     # ---- log rotation ----
 
     @property
     def max_log_size_mb(self) -> int:
         """Return the maximum log file size in MB before rotation."""
-        return int(self._data.get("max_log_size_mb", 10))
+        return self._d.max_log_size_mb
 
     @max_log_size_mb.setter
     def max_log_size_mb(self, value: int) -> None:
         """Set the maximum log file size in MB (minimum 1)."""
-        self._data["max_log_size_mb"] = max(1, int(value))
+        self._d.max_log_size_mb = _NORMALISERS["max_log_size_mb"](value)
 
     @property
     def log_backup_count(self) -> int:
         """Return the number of rotated log backups to keep."""
-        return int(self._data.get("log_backup_count", 3))
+        return self._d.log_backup_count
 
     @log_backup_count.setter
     def log_backup_count(self, value: int) -> None:
         """Set the number of rotated log backups to keep."""
-        self._data["log_backup_count"] = max(0, int(value))
+        self._d.log_backup_count = _NORMALISERS["log_backup_count"](value)
 
     # ---- convenience ----
 
@@ -3,48 +3,272 @@
 Copies files from the watched source folder to the destination,
 preserving relative structure when subdirectory mode is on.
 Supports collision protection with configurable rename tokens,
-SHA-256 post-copy verification, file-size gating, and automatic
+BLAKE3/SHA-256 post-copy verification, file-size gating, and automatic
 retry with configurable count and delay.
-Runs copies in background threads to keep the UI responsive.
+Runs copies on a small, bounded worker pool to keep the UI responsive
+without interleaving too many writes on the destination disk.
 """
 
+import contextlib
+import ctypes
+import errno
+import functools
 import hashlib
+import itertools
 import logging
+import mmap
+import os
 import shutil
+import string
 import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from acb_sync.config import (
+    CHECKSUM_BLAKE3,
+    CHECKSUM_SHA256,
     COLLISION_OVERWRITE,
     COLLISION_RENAME,
     COLLISION_SKIP,
 )
+from acb_sync.filters import FileFilter
+from acb_sync.platform_utils import IS_LINUX, IS_MACOS
+
+try:
+    import blake3  # type: ignore[import-not-found]
+
+    _HAS_BLAKE3 = True
+except ImportError:
+    _HAS_BLAKE3 = False
 
 logger = logging.getLogger(__name__)
 
-_HASH_CHUNK = 256 * 1024  # 256 KiB read chunks for hashing
+_HASH_CHUNK = 4 * 1024 * 1024  # 4 MiB (page-aligned) copy/hash buffer
+_MMAP_THRESHOLD = 16 * 1024 * 1024  # hash files this large via mmap
+_DROP_CACHE_THRESHOLD = 64 * 1024 * 1024  # evict copies this large from cache
+_HISTORY_LIMIT = 1000  # copy records kept in CopyStats.history
+_MAX_RENAME_COUNTER = 10_000  # highest {n} tried before a timestamp fallback
+_RANGE_CHUNK = 64 * 1024 * 1024  # bytes per copy_file_range call between stop checks
+
+_FORMATTER = string.Formatter()
+# (literal text, field name, format spec, conversion) from Formatter.parse
+_PatternPart = tuple[str, str | None, str | None, str | None]
+_ALGO_LABELS = {CHECKSUM_BLAKE3: "BLAKE3", CHECKSUM_SHA256: "SHA-256"}
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _effective_algo(algo: str) -> str:
+    """Return the checksum algorithm actually used for *algo*.
 
+    BLAKE3 needs the optional ``blake3`` package; without it SHA-256 is used.
+    """
+    if algo == CHECKSUM_BLAKE3 and _HAS_BLAKE3:
+        return CHECKSUM_BLAKE3
+    return CHECKSUM_SHA256
+
+
+def _new_hasher(algo: str) -> Any:
+    """Return a fresh incremental hasher for *algo*."""
+    if _effective_algo(algo) == CHECKSUM_BLAKE3:
+        return blake3.blake3()
+    return hashlib.sha256()
 
-def _sha256(filepath: Path) -> str:
-    """Return the hex SHA-256 digest of *filepath*."""
-    h = hashlib.sha256()
+
+def _file_digest(filepath: Path, algo: str) -> str:
+    """Return the hex digest of *filepath* using *algo*."""
+    if _effective_algo(algo) == CHECKSUM_BLAKE3:
+        return blake3.blake3().update_mmap(filepath).hexdigest()
     with open(filepath, "rb") as fh:
-        while chunk := fh.read(_HASH_CHUNK):
-            h.update(chunk)
+        if os.fstat(fh.fileno()).st_size < _MMAP_THRESHOLD:
+            return hashlib.file_digest(fh, CHECKSUM_SHA256).hexdigest()
+        # One update() over the whole mapping: hashlib drops the GIL for
+        # the entire buffer instead of once per chunk.
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha256(mm).hexdigest()
+
+
+# errno values meaning "this fast path is not available here, use another"
+_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP}
+)
+
+_clonefile: Any = None
+
+
+def _macos_clonefile(src: Path, dst: Path) -> bool:
+    """Try an APFS ``clonefile(2)``; return False if cloning is not possible."""
+    global _clonefile
+    if _clonefile is None:
+        libc = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+        _clonefile = libc.clonefile
+        _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        _clonefile.restype = ctypes.c_int
+    if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in _FALLBACK_ERRNOS:
+        return False
+    raise OSError(err, os.strerror(err), str(src))
+
+
+def _check_stop(stop: threading.Event | None) -> None:
+    """Raise ``InterruptedError`` if the copier has been told to stop."""
+    if stop is not None and stop.is_set():
+        raise InterruptedError("Copy cancelled (copier shutting down)")
+
+
+def _linux_copy_file_range(
+    src: Path, dst: Path, stop: threading.Event | None = None
+) -> bool:
+    """Copy with ``copy_file_range(2)``; return False if it is unsupported.
+
+    The kernel moves the data without a round trip through user space and
+    can share extents (reflink) on filesystems such as Btrfs and XFS.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        while copied < size:
+            _check_stop(stop)
+            try:
+                n = os.copy_file_range(
+                    fsrc.fileno(), fdst.fileno(), min(size - copied, _RANGE_CHUNK)
+                )
+            except OSError as exc:
+                if copied == 0 and exc.errno in _FALLBACK_ERRNOS:
+                    return False
+                raise
+            if n == 0:
+                if copied == 0:
+                    # Some FUSE/CIFS/pseudo filesystems report 0 instead
+                    # of an error; let shutil.copy2 do the copy
+                    return False
+                break  # source shrank underneath us
+            copied += n
+    return True
+
+
+def _fast_copy(src: Path, dst: Path, stop: threading.Event | None = None) -> None:
+    """Copy *src* to *dst* with data and metadata, like ``shutil.copy2``.
+
+    Tries a copy-on-write clone (macOS) or in-kernel ``copy_file_range``
+    (Linux) first.  Everything else goes through ``shutil.copy2``, which
+    already uses ``sendfile``/``fcopyfile`` and, on Windows, ``CopyFile2``.
+    Only the ``copy_file_range`` path can be interrupted by *stop*.
+    """
+    if IS_MACOS and not dst.exists() and _macos_clonefile(src, dst):
+        return  # clonefile carries the metadata over itself
+    if (
+        IS_LINUX
+        and hasattr(os, "copy_file_range")
+        and _linux_copy_file_range(src, dst, stop)
+    ):
+        shutil.copystat(src, dst)
+        return
+    shutil.copy2(src, dst)
+
+
+def _drop_cache(path: Path) -> None:
+    """Tell the OS that *path*'s cached pages will not be read again.
+
+    Recordings are copied once and rarely re-read, so keeping them in the
+    page cache only evicts other programs' working sets.  Only available
+    where ``posix_fadvise`` exists; elsewhere the OS cache policy applies.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _copy_and_hash(
+    src: Path, dst: Path, algo: str, stop: threading.Event | None = None
+) -> str:
+    """Copy *src* to *dst* like ``shutil.copy2`` and return the source digest.
+
+    The source is hashed from the same buffers that are written to the
+    destination, so verification does not need a second pass over it.
+    Raises ``InterruptedError`` between blocks once *stop* is set.
+    """
+    h = _new_hasher(algo)
+    # One reusable buffer: each block is read into it and handed to both
+    # the writer and the hasher as a memoryview, with no per-block bytes.
+    buf = bytearray(_HASH_CHUNK)
+    view = memoryview(buf)
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        if hasattr(os, "posix_fadvise"):
+            with contextlib.suppress(OSError):
+                os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while n := fsrc.readinto(buf):
+            _check_stop(stop)
+            block = view[:n]
+            fdst.write(block)
+            h.update(block)
+    shutil.copystat(src, dst)
     return h.hexdigest()
 
 
-def _expand_rename_pattern(
+def _iter_files(root: str, recursive: bool) -> Iterator[os.DirEntry[str]]:
+    """Yield directory entries for the files under *root*.
+
+    Uses ``os.scandir`` so file-type checks come from the directory listing
+    instead of a ``stat`` per entry.  Directory symlinks are not followed;
+    unreadable sub-folders are logged and skipped.
+    """
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError as exc:
+            logger.warning("Cannot scan %s: %s", folder, exc)
+
+
+def _time_tokens(now: datetime) -> dict[str, str | int]:
+    """Return the date/time rename tokens for the moment *now*."""
+    return {
+        "date": now.strftime("%Y-%m-%d"),
+        "time": now.strftime("%H-%M-%S"),
+        "datetime": now.strftime("%Y-%m-%d_%H-%M-%S"),
+        "ts": int(now.timestamp()),
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_rename_pattern(pattern: str) -> tuple[_PatternPart, ...]:
+    """Split *pattern* into ``string.Formatter`` parts (cached per pattern)."""
+    return tuple(_FORMATTER.parse(pattern))
+
+
+def _rename_candidates(
     pattern: str,
     name: str,
     ext: str,
-    counter: int,
-) -> str:
-    """Expand token-based rename pattern.
+    time_tokens: dict[str, str | int],
+) -> Iterator[str]:
+    """Yield collision rename candidates for counters 1, 2, 3, ….
 
     Supported tokens:
       {name}     — filename without extension
@@ -54,20 +278,49 @@ def _expand_rename_pattern(
       {time}     — current time HH-MM-SS
       {datetime} — combined YYYY-MM-DD_HH-MM-SS
       {ts}       — integer Unix timestamp
-    """
-    now = datetime.now()
-    return pattern.format(
-        name=name,
-        ext=ext,
-        n=counter,
-        date=now.strftime("%Y-%m-%d"),
-        time=now.strftime("%H-%M-%S"),
-        datetime=now.strftime("%Y-%m-%d_%H-%M-%S"),
-        ts=int(now.timestamp()),
-    )
 
-
-@dataclass
+    Everything except ``{n}`` is rendered once, so each further candidate
+    only formats the counter.  A pattern without ``{n}`` yields one name.
+    """
+    values = {"name": name, "ext": ext, **time_tokens}
+    texts: list[str] = []  # rendered text around each {n}
+    counters: list[tuple[str | None, str]] = []  # (conversion, spec) per {n}
+    text = ""
+    for literal, field_name, spec, conversion in _parse_rename_pattern(pattern):
+        text += literal
+        if field_name is None:
+            continue
+        if spec and "{" in spec:
+            # Nested replacement fields in a format spec: let str.format
+            # resolve them the slow way.
+            yield from (
+                pattern.format(n=n, **values) for n in range(1, _MAX_RENAME_COUNTER)
+            )
+            return
+        if field_name == "n":
+            texts.append(text)
+            text = ""
+            counters.append((conversion, spec or ""))
+            continue
+        obj, _ = _FORMATTER.get_field(field_name, (), values)
+        text += _FORMATTER.format_field(
+            _FORMATTER.convert_field(obj, conversion), spec or ""
+        )
+    texts.append(text)
+    if not counters:
+        yield text
+        return
+    for n in range(1, _MAX_RENAME_COUNTER):
+        parts = [texts[0]]
+        for (conversion, spec), tail in zip(counters, texts[1:], strict=True):
+            parts.append(
+                _FORMATTER.format_field(_FORMATTER.convert_field(n, conversion), spec)
+            )
+            parts.append(tail)
+        yield "".join(parts)
+
+
+@dataclass(slots=True)
 class CopyRecord:
     """Record of a single file copy operation."""
 
@@ -96,7 +349,7 @@ class CopyRecord:
         return ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CopyStats:
     """Aggregated copy statistics."""
 
@@ -106,13 +359,18 @@ class CopyStats:
     total_bytes: int = 0
     total_verified: int = 0
     last_copied_file: str = ""
-    history: list[CopyRecord] = field(default_factory=list)
+    # Bumped on every record(), so viewers can tell what they have not seen
+    revision: int = 0
+    history: deque[CopyRecord] = field(
+        default_factory=lambda: deque(maxlen=_HISTORY_LIMIT)
+    )
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def record(self, rec: CopyRecord) -> None:
         """Record a completed copy and update aggregate stats."""
         with self._lock:
             self.history.append(rec)
+            self.revision += 1
             if rec.skipped:
                 self.total_skipped += 1
             elif rec.success:
@@ -123,9 +381,29 @@ class CopyStats:
                     self.total_verified += 1
             else:
                 self.total_failed += 1
-            # Keep last 1000 records
-            if len(self.history) > 1000:
-                self.history = self.history[-1000:]
+
+    def recent(self, n: int) -> list[CopyRecord]:
+        """Return up to the *n* most recent records, oldest first."""
+        with self._lock:
+            return self._newest(n)
+
+    def records_since(self, revision: int, n: int) -> tuple[int, list[CopyRecord]]:
+        """Return the current revision and records added after *revision*.
+
+        At most the *n* newest of those records are returned, oldest first.
+        """
+        with self._lock:
+            count = min(self.revision - revision, len(self.history), n)
+            if count <= 0:
+                return self.revision, []
+            return self.revision, self._newest(count)
+
+    def _newest(self, n: int) -> list[CopyRecord]:
+        # Walk from the right end: slicing a deque from the left costs
+        # O(len(history)) even when only the last few records are wanted
+        newest = list(itertools.islice(reversed(self.history), max(0, n)))
+        newest.reverse()
+        return newest
 
 
 class FileCopier:
@@ -133,9 +411,9 @@ class FileCopier:
 
     Parameters
     ----------
-    source_root : str
+    source_root : str or Path
         The root source folder being watched.
-    destination_root : str
+    destination_root : str or Path
         The destination folder to copy into.
     on_copy_complete : callable, optional
         Callback invoked after each copy with the CopyRecord.
@@ -146,7 +424,7 @@ class FileCopier:
     rename_pattern : str
         Token pattern for renamed files on collision.
     verify : bool
-        If True, compute SHA-256 checksums and compare after copy.
+        If True, checksum source and destination and compare after copy.
     min_size : int
         Skip files smaller than this (bytes). 0 = no minimum.
     max_size : int
@@ -155,13 +433,22 @@ class FileCopier:
         Number of retries on a failed copy (0 = no retries).
     retry_delay : int
         Seconds to wait between retry attempts.
+    file_filter : FileFilter, optional
+        Extension / glob filter applied by ``copy_all_now``.  Files handed
+        to ``copy_file`` are assumed to have been filtered already.
+    max_workers : int
+        Maximum number of files copied at the same time.  Further files
+        queue until a worker is free.
+    checksum_algo : str
+        ``"blake3"`` (falls back to SHA-256 if the ``blake3`` package is
+        missing) or ``"sha256"``.
 
     """
 
     def __init__(
         self,
-        source_root: str,
-        destination_root: str,
+        source_root: str | Path,
+        destination_root: str | Path,
         on_copy_complete: Callable[[CopyRecord], None] | None = None,
         preserve_structure: bool = False,
         collision_mode: str = COLLISION_RENAME,
@@ -171,6 +458,9 @@ class FileCopier:
         max_size: int = 0,
         retry_count: int = 0,
         retry_delay: int = 5,
+        checksum_algo: str = CHECKSUM_BLAKE3,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        file_filter: FileFilter | None = None,
     ):
         """Configure the file copier with the given options."""
         self.source_root = Path(source_root)
@@ -180,56 +470,131 @@ class FileCopier:
         self._collision_mode = collision_mode
         self._rename_pattern = rename_pattern
         self._verify = verify
+        self._checksum_algo = checksum_algo
+        self._file_filter = file_filter
         self._min_size = min_size
         self._max_size = max_size
         self._retry_count = retry_count
         self._retry_delay = retry_delay
         self.stats = CopyStats()
-        self._active_copies: int = 0
-        self._lock = threading.Lock()
+        # Futures queued or running; set add/discard are atomic, so the
+        # hot copy path needs no lock of its own.
+        self._in_flight: set[Future[None]] = set()
+        # Set by shutdown(cancel_pending=True) to abort running copies and
+        # retry waits; the pool's worker threads are not daemons.
+        self._stop = threading.Event()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="Copy"
+        )
+
+    def reconfigure(
+        self,
+        *,
+        collision_mode: str,
+        rename_pattern: str,
+        verify: bool,
+        min_size: int,
+        max_size: int,
+        retry_count: int,
+        retry_delay: int,
+        checksum_algo: str,
+        file_filter: FileFilter | None,
+    ) -> None:
+        """Apply new copy options in place.
+
+        Copies already in progress may finish with the previous options.
+        The source/destination roots, structure mode and worker count are
+        fixed for the lifetime of the copier.
+        """
+        self._collision_mode = collision_mode
+        self._rename_pattern = rename_pattern
+        self._verify = verify
+        self._min_size = min_size
+        self._max_size = max_size
+        self._retry_count = retry_count
+        self._retry_delay = retry_delay
+        self._checksum_algo = checksum_algo
+        self._file_filter = file_filter
 
     @property
     def active_copies(self) -> int:
-        """Return the number of copies currently in progress."""
-        with self._lock:
-            return self._active_copies
-
-    def copy_file(self, source_path: Path) -> None:
-        """Queue a background copy of *source_path* to the destination."""
-        thread = threading.Thread(
-            target=self._do_copy,
-            args=(source_path,),
-            daemon=True,
-            name=f"Copy-{source_path.name}",
-        )
-        thread.start()
+        """Return the number of copies queued or in progress."""
+        return len(self._in_flight)
+
+    def copy_file(self, source_path: Path, size: int | None = None) -> None:
+        """Queue a background copy of *source_path* to the destination.
+
+        *size* may be passed when the caller already knows the file size,
+        saving the worker a ``stat`` call.
+        """
+        try:
+            future = self._pool.submit(self._do_copy, source_path, size)
+        except RuntimeError:
+            # Pool already shut down (sync stopped while a file became ready)
+            logger.warning("Copier stopped; not copying %s", source_path)
+            return
+        self._in_flight.add(future)
+        # Runs immediately if the copy already finished
+        future.add_done_callback(self._in_flight.discard)
+
+    def shutdown(self, wait: bool = True, *, cancel_pending: bool = False) -> None:
+        """Stop accepting new copies.
+
+        If *cancel_pending* is True, queued copies that have not started are
+        dropped and running ones are abandoned at the next block boundary or
+        retry wait, removing their partial destination file; otherwise
+        running copies finish.  With *wait* the call blocks until the
+        workers are idle.
+        """
+        if cancel_pending:
+            self._stop.set()
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_pending)
 
     def copy_all_now(self) -> int:
         """Scan the source folder and copy every file that passes gating.
 
-        Returns the number of files queued for copy.
+        Files rejected by the size gate are recorded as skipped right here
+        rather than occupying a worker.  Returns the number of files queued
+        for copy.
         """
         count = 0
         src = self.source_root
         if not src.is_dir():
             return 0
-        pattern = "**/*" if self._preserve_structure else "*"
-        for item in src.glob(pattern):
-            if item.is_file():
-                self.copy_file(item)
-                count += 1
+        file_filter = self._file_filter
+        for entry in _iter_files(os.fspath(src), self._preserve_structure):
+            if file_filter is not None and not file_filter.matches(entry.name):
+                continue
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                continue  # vanished between listing and stat
+            ok, reason = self._passes_size_gate(size)
+            if not ok:
+                logger.info("Skipping %s: %s", entry.path, reason)
+                self._finish(
+                    CopyRecord(
+                        source=entry.path,
+                        destination="",
+                        size_bytes=size,
+                        finished=time.time(),
+                        skipped=True,
+                        error=reason,
+                    )
+                )
+                continue
+            self.copy_file(Path(entry.path), size)
+            count += 1
         return count
 
     def _base_destination(self, source_path: Path) -> Path:
         """Compute the base destination path (before collision handling)."""
         if self._preserve_structure:
             try:
-                rel = source_path.relative_to(self.source_root)
+                return self.destination_root / source_path.relative_to(self.source_root)
             except ValueError:
-                rel = Path(source_path.name)
-        else:
-            rel = Path(source_path.name)
-        return self.destination_root / rel
+                pass
+        return self.destination_root / source_path.name
 
     def _resolve_collision(self, dest: Path) -> Path | None:
         """Apply the configured collision strategy.
@@ -245,15 +610,29 @@ class FileCopier:
         if self._collision_mode == COLLISION_SKIP:
             return None  # caller records as skipped
 
-        # COLLISION_RENAME — expand pattern with incrementing counter
+        # COLLISION_RENAME — expand pattern with incrementing counter.
+        # Date/time tokens are fixed once so every candidate shares them.
         stem = dest.stem
         ext = dest.suffix.lstrip(".")
         parent = dest.parent
-        for n in range(1, 10_000):
-            new_name = _expand_rename_pattern(self._rename_pattern, stem, ext, n)
-            candidate = parent / new_name
-            if not candidate.exists():
-                return candidate
+        parent_str = os.fspath(parent)
+        pattern = self._rename_pattern
+        tokens = _time_tokens(datetime.now())
+        # One directory listing up front: names already taken are ruled out
+        # in memory instead of costing a syscall (or a network round trip)
+        # each.  The chosen name is still confirmed on disk, which also
+        # covers case-insensitive file systems and concurrent copies.
+        try:
+            with os.scandir(parent_str) as it:
+                taken = {entry.name for entry in it}
+        except OSError:
+            taken = set()
+        for new_name in _rename_candidates(pattern, stem, ext, tokens):
+            if new_name in taken:
+                continue
+            if not os.path.lexists(os.path.join(parent_str, new_name)):
+                return parent / new_name
+            taken.add(new_name)
 
         # Exhausted counter space — fall back to timestamp
         ts = int(time.time())
@@ -267,19 +646,27 @@ class FileCopier:
             return False, f"File too large ({size:,} > {self._max_size:,} bytes)"
         return True, ""
 
-    def _do_copy(self, source_path: Path) -> None:
-        rec = CopyRecord(source=str(source_path), destination="")
+    def _finish(self, rec: CopyRecord) -> None:
+        """Record *rec* in the stats and notify the completion callback."""
+        self.stats.record(rec)
+        if self._on_copy_complete:
+            try:
+                self._on_copy_complete(rec)
+            except Exception:
+                logger.exception("Error in on_copy_complete callback")
 
-        with self._lock:
-            self._active_copies += 1
+    def _do_copy(self, source_path: Path, size: int | None = None) -> None:
+        rec = CopyRecord(source=os.fspath(source_path), destination="")
 
         try:
-            if not source_path.exists():
-                rec.error = "Source file no longer exists"
-                logger.warning("Source file vanished before copy: %s", source_path)
-                return
-
-            rec.size_bytes = source_path.stat().st_size
+            if size is None:
+                try:
+                    size = source_path.stat().st_size
+                except FileNotFoundError:
+                    rec.error = "Source file no longer exists"
+                    logger.warning("Source file vanished before copy: %s", source_path)
+                    return
+            rec.size_bytes = size
 
             # ---- size gating ----
             ok, reason = self._passes_size_gate(rec.size_bytes)
@@ -297,16 +684,22 @@ class FileCopier:
             dest = self._resolve_collision(base_dest)
             if dest is None:
                 rec.skipped = True
-                rec.destination = str(base_dest)
+                rec.destination = os.fspath(base_dest)
                 rec.error = "Skipped (collision, file already exists)"
                 rec.finished = time.time()
                 logger.info("Skipping (collision): %s", base_dest)
                 return
 
-            rec.destination = str(dest)
+            rec.destination = os.fspath(dest)
 
             # ---- copy with retries ----
+            # Bind the options once: a concurrent reconfigure() must not
+            # change verification half-way through a copy.
+            verify = self._verify
+            algo = _effective_algo(self._checksum_algo)
+            retry_delay = self._retry_delay
             max_attempts = 1 + max(0, self._retry_count)
+            stop = self._stop
             for attempt in range(1, max_attempts + 1):
                 rec.started = time.time()
                 rec.success = False
@@ -322,28 +715,29 @@ class FileCopier:
                         attempt,
                         max_attempts,
                     )
-                    shutil.copy2(str(source_path), str(dest))
-                    rec.finished = time.time()
-
-                    # ---- post-copy verification ----
-                    if self._verify:
-                        src_hash = _sha256(source_path)
-                        dst_hash = _sha256(dest)
+                    if verify:
+                        src_hash = _copy_and_hash(source_path, dest, algo, stop)
+                        rec.finished = time.time()
+                        # ---- post-copy verification ----
+                        dst_hash = _file_digest(dest, algo)
                         if src_hash == dst_hash:
                             rec.verified = True
                             rec.success = True
                             logger.info(
-                                "Verified copy (SHA-256 match) in %.1fs: %s",
+                                "Verified copy (%s match) in %.1fs: %s",
+                                _ALGO_LABELS[algo],
                                 rec.duration,
                                 dest,
                             )
                         else:
                             rec.error = (
-                                f"Verification failed: SHA-256 mismatch "
+                                f"Verification failed: {_ALGO_LABELS[algo]} mismatch "
                                 f"(src={src_hash[:12]}… dst={dst_hash[:12]}…)"
                             )
                             logger.error("Checksum mismatch for %s", dest)
                     else:
+                        _fast_copy(source_path, dest, stop)
+                        rec.finished = time.time()
                         if dest.exists() and dest.stat().st_size == rec.size_bytes:
                             rec.success = True
                             logger.info(
@@ -353,32 +747,44 @@ class FileCopier:
                             rec.error = "Post-copy size mismatch"
                             logger.error("Size mismatch after copying %s", dest)
 
+                except InterruptedError as exc:
+                    # Only _check_stop raises this, and only once dest has
+                    # been opened for writing: remove the truncated file
+                    rec.error = str(exc)
+                    rec.finished = time.time()
+                    logger.warning("Copy of %s cancelled at shutdown", source_path)
+                    with contextlib.suppress(OSError):
+                        dest.unlink(missing_ok=True)
+                    break
                 except OSError as exc:
                     rec.error = str(exc)
                     rec.finished = time.time()
                     logger.error("Copy failed for %s: %s", source_path, exc)
 
+                if stop.is_set() and not rec.success:
+                    break  # shutting down: no retries
+
                 if rec.success:
+                    if rec.size_bytes >= _DROP_CACHE_THRESHOLD:
+                        # Source pages are clean and can go now.  The fresh
+                        # destination pages are still dirty, and DONTNEED
+                        # does not evict dirty pages, so they are left to
+                        # the OS writeback.
+                        _drop_cache(source_path)
                     break  # no need to retry
 
                 if attempt < max_attempts:
                     logger.info(
                         "Retrying in %ds (attempt %d failed)…",
-                        self._retry_delay,
+                        retry_delay,
                         attempt,
                     )
-                    time.sleep(self._retry_delay)
+                    if stop.wait(retry_delay):
+                        break  # shutting down
 
         except Exception as exc:
             rec.error = str(exc)
             rec.finished = time.time()
             logger.exception("Unexpected error copying %s", source_path)
         finally:
-            with self._lock:
-                self._active_copies -= 1
-            self.stats.record(rec)
-            if self._on_copy_complete:
-                try:
-                    self._on_copy_complete(rec)
-                except Exception:
-                    logger.exception("Error in on_copy_complete callback")
+            self._finish(rec)
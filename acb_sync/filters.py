@@ -0,0 +1,68 @@
+"""File name filtering shared by the watcher and the copier.
+
+Extension lists and include/exclude glob patterns from the config are
+compiled once into a ``FileFilter`` so each file name is checked with a
+set lookup and at most two regex matches.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import re
+from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def compile_globs(patterns: Iterable[str] | None) -> re.Pattern[str] | None:
+    """Compile glob *patterns* into a single case-insensitive regex.
+
+    Returns None when there are no patterns, so callers can skip matching
+    entirely.  The result is meant to be built once per sync session rather
+    than re-translating every glob on each file event.
+    """
+    globs = [p for p in patterns or () if p]
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in globs), re.IGNORECASE)
+
+
+def normalise_extensions(extensions: Iterable[str] | None) -> frozenset[str] | None:
+    """Return a lowercase, dot-less extension set (None = accept all)."""
+    exts = frozenset(e.lower().lstrip(".") for e in extensions or () if e)
+    return exts or None
+
+
+class FileFilter:
+    """Decide whether a file name passes the extension and glob filters.
+
+    Empty or missing lists accept everything.
+    """
+
+    __slots__ = ("exclude_re", "extensions", "include_re")
+
+    def __init__(
+        self,
+        extensions: Iterable[str] | None = None,
+        include_patterns: Iterable[str] | None = None,
+        exclude_patterns: Iterable[str] | None = None,
+    ):
+        """Compile the given extension list and glob patterns."""
+        self.extensions = normalise_extensions(extensions)
+        self.include_re = compile_globs(include_patterns)
+        self.exclude_re = compile_globs(exclude_patterns)
+
+    def matches(self, name: str) -> bool:
+        """Return True if the file *name* (no directory part) should be copied."""
+        # Include patterns first — file must match at least one
+        if self.include_re is not None and not self.include_re.match(name):
+            logger.debug("Ignoring %s (does not match any include pattern)", name)
+            return False
+        if self.exclude_re is not None and self.exclude_re.match(name):
+            logger.debug("Excluding %s (matches an exclude pattern)", name)
+            return False
+        if self.extensions is None:
+            return True
+        return os.path.splitext(name)[1].lower().lstrip(".") in self.extensions
@@ -9,8 +9,10 @@ Supported on Windows and macOS (macOS requires Accessibility
 permissions in System Settings > Privacy & Security > Accessibility).
 """
 
+import functools
 import logging
 from collections.abc import Callable
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,20 @@ except ImportError:
     logger.warning("keyboard library not installed — global hotkeys disabled.")
 
 
+@functools.cache
+def _parse(key: str) -> Any:
+    """Return the ``keyboard`` scan-code form of *key*, parsed only once.
+
+    ``add_hotkey`` accepts the parsed form as-is, so re-registering a combo
+    after a settings change skips tokenising the string again.
+    """
+    return _kb.parse_hotkey(key)
+
+
+# Slot order shared by the key, callback and handle sequences
+_SLOT_NAMES = ("pause_resume", "copy_now", "status", "settings", "quit")
+
+
 class GlobalHotkeys:
     """Register and unregister up to five global hotkeys.
 
@@ -38,6 +54,8 @@ class GlobalHotkeys:
 
     """
 
+    __slots__ = ("_callbacks", "_handles", "_keys", "_registered")
+
     def __init__(
         self,
         pause_resume_key: str,
@@ -52,20 +70,22 @@ class GlobalHotkeys:
         on_quit: Callable[[], None],
     ):
         """Bind the five hotkey slots to their callbacks."""
-        self._keys = {
-            "pause_resume": pause_resume_key,
-            "copy_now": copy_now_key,
-            "status": status_key,
-            "settings": settings_key,
-            "quit": quit_key,
-        }
-        self._callbacks = {
-            "pause_resume": on_pause_resume,
-            "copy_now": on_copy_now,
-            "status": on_status,
-            "settings": on_settings,
-            "quit": on_quit,
-        }
+        self._keys = [
+            pause_resume_key,
+            copy_now_key,
+            status_key,
+            settings_key,
+            quit_key,
+        ]
+        self._callbacks = (
+            on_pause_resume,
+            on_copy_now,
+            on_status,
+            on_settings,
+            on_quit,
+        )
+        # Handle returned by keyboard.add_hotkey for each slot (None = unhooked)
+        self._handles: list[Any] = [None] * len(_SLOT_NAMES)
         self._registered = False
 
     @property
@@ -80,19 +100,50 @@ class GlobalHotkeys:
             return
         if self._registered:
             return
+        bound = [self._bind(slot) for slot in range(len(_SLOT_NAMES))]
+        self._registered = True
+        self._log_bound(bound)
+
+    def _bind(self, slot: int) -> str:
+        """Register the combo for *slot*, if one is assigned.
+
+        Returns ``"name = combo"`` for a newly hooked slot, or an empty
+        string, so callers can log everything they bound in one record.
+        """
+        key = self._keys[slot]
+        if not key:
+            return ""
+        name = _SLOT_NAMES[slot]
+        try:
+            self._handles[slot] = _kb.add_hotkey(
+                _parse(key), self._callbacks[slot], suppress=False
+            )
+        except Exception:
+            logger.exception("Failed to register hotkey %s = %s", name, key)
+            return ""
+        return f"{name} = {key}"
+
+    @staticmethod
+    def _log_bound(bound: list[str]) -> None:
+        if logger.isEnabledFor(logging.INFO) and any(bound):
+            logger.info("Registered hotkeys: %s", ", ".join(filter(None, bound)))
+
+    def _unbind(self, slot: int) -> None:
+        """Remove the hook for *slot*, if it has one."""
+        handle = self._handles[slot]
+        if handle is None:
+            return
+        self._handles[slot] = None
         try:
-            for name, key in self._keys.items():
-                if key:
-                    _kb.add_hotkey(key, self._callbacks[name], suppress=False)
-                    logger.info("Registered hotkey %s = %s", name, key)
-            self._registered = True
+            _kb.remove_hotkey(handle)
         except Exception:
-            logger.exception("Failed to register global hotkeys.")
+            logger.exception("Error unregistering hotkey %s.", _SLOT_NAMES[slot])
 
     def unregister(self) -> None:
         """Unregister all global hotkeys."""
         if not _HAS_KEYBOARD or not self._registered:
             return
+        self._handles = [None] * len(_SLOT_NAMES)
         try:
             _kb.unhook_all_hotkeys()
             self._registered = False
@@ -108,11 +159,15 @@ class GlobalHotkeys:
         settings_key: str = "",
         quit_key: str = "",
     ) -> None:
-        """Re-register hotkeys with new key combos."""
-        self.unregister()
-        self._keys["pause_resume"] = pause_resume_key
-        self._keys["copy_now"] = copy_now_key
-        self._keys["status"] = status_key
-        self._keys["settings"] = settings_key
-        self._keys["quit"] = quit_key
-        self.register()
+        """Apply new key combos, re-hooking only the slots that changed."""
+        new_keys = (pause_resume_key, copy_now_key, status_key, settings_key, quit_key)
+        bound: list[str] = []
+        for slot, key in enumerate(new_keys):
+            if key == self._keys[slot]:
+                continue
+            if self._registered:
+                self._unbind(slot)
+            self._keys[slot] = key
+            if self._registered:
+                bound.append(self._bind(slot))
+        self._log_bound(bound)
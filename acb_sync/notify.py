@@ -6,14 +6,24 @@ back to the built-in ``say`` command so VoiceOver users get spoken
 alerts.  On other platforms the notifications are silently discarded.
 """
 
+import contextlib
 import logging
+import queue
 import subprocess
 import threading
+import time
+from typing import Any
 
 from acb_sync.platform_utils import IS_MACOS, IS_WINDOWS
 
 logger = logging.getLogger(__name__)
 
+# Announcements waiting to be spoken; extra ones are dropped, not queued
+_QUEUE_SIZE = 16
+
+# An identical message repeated within this many seconds is not spoken again
+_REPEAT_WINDOW = 0.2
+
 # ---- accessible_output2 (Windows screen readers) ----
 _HAS_AO2 = False
 if IS_WINDOWS:
@@ -29,20 +39,49 @@ if IS_WINDOWS:
         )
 
 
+# ---- AppKit speech synthesiser (macOS, via pystray's PyObjC dependency) ----
+_HAS_APPKIT = False
+if IS_MACOS:
+    try:
+        from AppKit import NSSpeechSynthesizer  # type: ignore[import-not-found]
+
+        _HAS_APPKIT = True
+    except ImportError:
+        pass
+
+
 class ScreenReaderNotifier:
     """Thread-safe cross-platform speech notifier.
 
     - Windows: accessible_output2 (JAWS / NVDA / Narrator)
-    - macOS: ``say`` CLI command (heard by VoiceOver users)
+    - macOS: in-process system voice via AppKit, or the ``say`` command
+      if PyObjC is unavailable (heard by VoiceOver users)
     - Other: silent no-op
 
     Call ``speak(text)`` to push an announcement.
-    The call is non-blocking — speech is dispatched on a daemon thread.
+    The call is non-blocking — announcements are queued for a single
+    daemon worker thread, started on first use.
     """
 
     def __init__(self) -> None:
-        """Detect and bind to the active screen reader output."""
-        self._output = _AO2Auto() if _HAS_AO2 else None  # type: ignore[name-defined]
+        """Prepare the speech queue; backends are bound on first use."""
+        # Screen reader probing is slow (COM on Windows), so the AO2 output is
+        # created by the worker on the first announcement, not at import
+        self._output: Any = None
+        # No backend at all (e.g. Linux): speak() returns straight away
+        self._is_noop = not (_HAS_AO2 or IS_MACOS)
+        self._queue: queue.Queue[tuple[str, bool]] = queue.Queue(maxsize=_QUEUE_SIZE)
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        # macOS synthesiser, created on the worker thread on first use
+        self._synth: Any = None
+        # Running `say` process (macOS without PyObjC), so it can be interrupted
+        self._say_proc: subprocess.Popen[bytes] | None = None
+        self._say_lock = threading.Lock()
+        # Last announcement accepted, for dropping back-to-back repeats
+        self._last_text = ""
+        self._last_ts = 0.0
+        self._last_lock = threading.Lock()
 
     def speak(self, text: str, interrupt: bool = True) -> None:
         """Announce *text* via the active screen reader or system TTS.
@@ -55,35 +94,99 @@ class ScreenReaderNotifier:
             If True, interrupt any in-progress speech first.
 
         """
-        if not self._output and not IS_MACOS:
-            logger.debug("SR notify (no output): %s", text)
+        if self._is_noop:
             return
 
-        # Fire-and-forget on a daemon thread so we never block
-        threading.Thread(
-            target=self._do_speak,
-            args=(text, interrupt),
-            daemon=True,
-            name="SRNotify",
-        ).start()
+        now = time.monotonic()
+        with self._last_lock:
+            if text == self._last_text and now - self._last_ts < _REPEAT_WINDOW:
+                logger.debug("SR dropping repeat: %s", text)
+                return
+            self._last_text, self._last_ts = text, now
+
+        self._ensure_worker()
+        if interrupt:
+            # Latest wins: anything still waiting is stale now
+            self._drain()
+            self._stop_say()
+        try:
+            self._queue.put_nowait((text, interrupt))
+        except queue.Full:
+            logger.debug("SR queue full, dropping: %s", text)
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, daemon=True, name="SRNotify"
+                )
+                self._worker.start()
+
+    def _drain(self) -> None:
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            text, interrupt = self._queue.get()
+            self._do_speak(text, interrupt)
 
     def _do_speak(self, text: str, interrupt: bool) -> None:
         try:
-            if self._output:
+            if _HAS_AO2:
+                if self._output is None:
+                    self._output = _AO2Auto()  # type: ignore[name-defined]
                 self._output.speak(text, interrupt=interrupt)
                 logger.debug("SR spoke: %s", text)
+            elif _HAS_APPKIT:
+                self._speak_appkit(text, interrupt)
+                logger.debug("macOS speech: %s", text)
             elif IS_MACOS:
-                # macOS: use the built-in `say` command
-                subprocess.run(
-                    ["say", text],
-                    timeout=15,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+                # macOS without PyObjC: use the built-in `say` command
+                self._speak_say(text)
                 logger.debug("macOS say: %s", text)
         except Exception:
             logger.debug("Speech notification failed.", exc_info=True)
 
+    def _speak_say(self, text: str) -> None:
+        proc = subprocess.Popen(
+            ["say", text], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        with self._say_lock:
+            self._say_proc = proc
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        finally:
+            with self._say_lock:
+                self._say_proc = None
+
+    def _stop_say(self) -> None:
+        # Cut off a running `say` so an interrupting message isn't held up
+        with self._say_lock:
+            proc = self._say_proc
+        if proc is not None and proc.poll() is None:
+            with contextlib.suppress(OSError):
+                proc.terminate()
+
+    def _speak_appkit(self, text: str, interrupt: bool) -> None:
+        # One long-lived synthesiser: no fork/exec or framework load per call
+        synth = self._synth
+        if synth is None:
+            synth = NSSpeechSynthesizer.alloc().initWithVoice_(None)  # type: ignore[name-defined]
+            self._synth = synth
+        if interrupt:
+            synth.stopSpeaking()
+        else:
+            while synth.isSpeaking():
+                time.sleep(0.05)
+        synth.startSpeakingString_(text)
+
     @property
     def available(self) -> bool:
         """True if a speech backend is available."""
@@ -12,11 +12,15 @@ Supported platforms:
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
 import logging
 import os
 import subprocess
 import sys
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +30,30 @@ IS_WINDOWS: bool = sys.platform == "win32"
 IS_MACOS: bool = sys.platform == "darwin"
 IS_LINUX: bool = sys.platform.startswith("linux")
 
+if IS_WINDOWS:
+    import winreg  # type: ignore[import-untyped]
+    import winsound  # type: ignore[import-untyped]
+
+# AppKit comes with pystray's PyObjC backend on macOS
+_HAS_APPKIT = False
+if IS_MACOS:
+    try:
+        from AppKit import NSSound  # type: ignore[import-not-found]
+
+        _HAS_APPKIT = True
+    except ImportError:
+        pass
+
 # ---- directories -------------------------------------------------------
 
 
+@functools.cache
 def get_config_dir() -> Path:
     r"""Return the application config directory, created if needed.
 
+    The result is cached for the life of the process, so the environment
+    lookup and ``mkdir`` only happen on the first call.
+
     - Windows : ``%APPDATA%\StreamWatcher``
     - macOS   : ``~/Library/Application Support/StreamWatcher``
     - Linux   : ``$XDG_CONFIG_HOME/StreamWatcher`` (default ``~/.config``)
@@ -48,11 +70,32 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+@functools.cache
 def get_log_path() -> Path:
     """Return the path to the log file (inside the config directory)."""
     return get_config_dir() / "stream_watcher.log"
 
 
+def atomic_write_text(path: Path, data: str) -> None:
+    """Write *data* to *path* so readers never see a partial file.
+
+    The text goes to a temporary sibling first and is swapped into place
+    with ``os.replace``; on failure the temporary file is removed and the
+    error re-raised.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
+        raise
+
+
 # ---- UI helpers ---------------------------------------------------------
 
 
@@ -77,16 +120,63 @@ def get_super_modifier_label() -> str:
 # ---- desktop integration -----------------------------------------------
 
 
+def _open_windows(fp: str) -> None:
+    os.startfile(fp)  # type: ignore[attr-defined]
+
+
+def _open_macos(fp: str) -> None:
+    subprocess.Popen(["open", fp])
+
+
+def _open_xdg(fp: str) -> None:
+    subprocess.Popen(["xdg-open", fp])
+
+
+def _beep_windows() -> None:
+    winsound.MessageBeep(winsound.MB_ICONHAND)
+
+
+# Loaded on first use and kept; NSSound caches the decoded audio
+_basso: Any = None
+
+
+def _beep_appkit() -> None:
+    global _basso
+    if _basso is None:
+        _basso = NSSound.soundNamed_("Basso")  # type: ignore[name-defined]
+    # play() is a no-op while the sound is still playing, so bursts coalesce
+    _basso.play()
+
+
+def _beep_macos() -> None:
+    # Basso is the standard macOS alert sound
+    subprocess.Popen(
+        ["afplay", "/System/Library/Sounds/Basso.aiff"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _beep_none() -> None:
+    # Linux: no universal system sound — skip
+    pass
+
+
+# The platform never changes at runtime, so pick the implementations once
+if IS_WINDOWS:
+    _open, _beep = _open_windows, _beep_windows
+elif IS_MACOS:
+    _open = _open_macos
+    _beep = _beep_appkit if _HAS_APPKIT else _beep_macos
+else:
+    _open, _beep = _open_xdg, _beep_none
+
+
 def open_file_in_default_app(filepath: str | Path) -> None:
     """Open a file with the OS default application."""
     fp = str(filepath)
     try:
-        if IS_WINDOWS:
-            os.startfile(fp)  # type: ignore[attr-defined]
-        elif IS_MACOS:
-            subprocess.Popen(["open", fp])
-        else:
-            subprocess.Popen(["xdg-open", fp])
+        _open(fp)
     except Exception:
         logger.warning("Could not open file: %s", fp, exc_info=True)
 
@@ -94,18 +184,7 @@ def open_file_in_default_app(filepath: str | Path) -> None:
 def play_error_sound() -> None:
     """Play the OS error/alert sound.  Silent on unsupported platforms."""
     try:
-        if IS_WINDOWS:
-            import winsound  # type: ignore[import-untyped]
-
-            winsound.MessageBeep(winsound.MB_ICONHAND)
-        elif IS_MACOS:
-            # Basso is the standard macOS alert sound
-            subprocess.Popen(
-                ["afplay", "/System/Library/Sounds/Basso.aiff"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        # Linux: no universal system sound — skip
+        _beep()
     except Exception:
         logger.debug("Could not play error sound.", exc_info=True)
 
@@ -116,38 +195,14 @@ _AUTOSTART_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 _AUTOSTART_NAME = "StreamWatcher"
 _LAUNCHD_LABEL = "com.acbmedia.streamwatcher"
 
-
-def register_autostart() -> bool:
-    """Register Stream Watcher to start at login.  Returns True on success."""
-    exe = sys.executable
-    cmd = f'"{exe}" -m acb_sync'
-
-    if IS_WINDOWS:
-        try:
-            import winreg  # type: ignore[import-untyped]
-
-            with winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, _AUTOSTART_KEY, 0, winreg.KEY_SET_VALUE
-            ) as key:
-                winreg.SetValueEx(key, _AUTOSTART_NAME, 0, winreg.REG_SZ, cmd)
-            logger.info("Registered Windows autostart.")
-            return True
-        except Exception:
-            logger.exception("Failed to register Windows autostart.")
-            return False
-
-    if IS_MACOS:
-        plist_dir = Path.home() / "Library" / "LaunchAgents"
-        plist_dir.mkdir(parents=True, exist_ok=True)
-        plist_path = plist_dir / f"{_LAUNCHD_LABEL}.plist"
-        plist_content = f"""\
+_LAUNCHD_PLIST_TEMPLATE = """\
 <?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
   "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
     <key>Label</key>
-    <string>{_LAUNCHD_LABEL}</string>
+    <string>{label}</string>
     <key>ProgramArguments</key>
     <array>
         <string>{exe}</string>
@@ -161,22 +216,8 @@ def register_autostart() -> bool:
 </dict>
 </plist>
 """
-        try:
-            plist_path.write_text(plist_content, encoding="utf-8")
-            logger.info("Created launchd plist at %s", plist_path)
-            return True
-        except Exception:
-            logger.exception("Failed to create launchd plist.")
-            return False
 
-    if IS_LINUX:
-        autostart_dir = (
-            Path(os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config")))
-            / "autostart"
-        )
-        autostart_dir.mkdir(parents=True, exist_ok=True)
-        desktop_path = autostart_dir / "stream-watcher.desktop"
-        desktop_content = f"""\
+_DESKTOP_ENTRY_TEMPLATE = """\
 [Desktop Entry]
 Type=Application
 Name=Stream Watcher
@@ -185,8 +226,110 @@ Hidden=false
 NoDisplay=false
 X-GNOME-Autostart-enabled=true
 """
+
+# Cached read/write handle to the HKCU Run key (Windows only)
+_run_key: Any = None
+
+
+def _get_run_key() -> Any:
+    """Open the HKCU Run key once and reuse the handle for the process lifetime."""
+    global _run_key
+    if _run_key is None:
+        _run_key = winreg.OpenKey(
+            winreg.HKEY_CURRENT_USER,
+            _AUTOSTART_KEY,
+            0,
+            winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE,
+        )
+        atexit.register(_run_key.Close)
+    return _run_key
+
+
+def _launchd_plist_path() -> Path:
+    """Return the per-user LaunchAgent plist path (macOS)."""
+    return Path.home() / "Library" / "LaunchAgents" / f"{_LAUNCHD_LABEL}.plist"
+
+
+def _desktop_entry_path() -> Path:
+    """Return the XDG autostart desktop-entry path (Linux)."""
+    return (
+        Path(os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config")))
+        / "autostart"
+        / "stream-watcher.desktop"
+    )
+
+
+def _autostart_command() -> str:
+    """Return the Windows Run-key command line for the current interpreter."""
+    return f'"{sys.executable}" -m acb_sync'
+
+
+def _launchd_plist_content() -> str:
+    """Return the LaunchAgent plist that starts the GUI at login (macOS)."""
+    return _LAUNCHD_PLIST_TEMPLATE.format_map(
+        {"label": _LAUNCHD_LABEL, "exe": sys.executable}
+    )
+
+
+def _desktop_entry_content() -> str:
+    """Return the XDG autostart desktop entry (Linux)."""
+    return _DESKTOP_ENTRY_TEMPLATE.format_map({"exe": sys.executable})
+
+
+def is_autostart_registered() -> bool:
+    """Return True if the current autostart entry matches this installation.
+
+    An entry pointing at a different Python interpreter counts as not
+    registered, so ``register_autostart`` will refresh it.
+    """
+    if IS_WINDOWS:
+        try:
+            value, _ = winreg.QueryValueEx(_get_run_key(), _AUTOSTART_NAME)
+            return value == _autostart_command()
+        except OSError:
+            return False
+
+    if IS_MACOS:
+        path, expected = _launchd_plist_path(), _launchd_plist_content()
+    elif IS_LINUX:
+        path, expected = _desktop_entry_path(), _desktop_entry_content()
+    else:
+        return False
+    try:
+        return path.read_text(encoding="utf-8") == expected
+    except OSError:
+        return False
+
+
+def register_autostart() -> bool:
+    """Register Stream Watcher to start at login.  Returns True on success."""
+    if IS_WINDOWS:
         try:
-            desktop_path.write_text(desktop_content, encoding="utf-8")
+            winreg.SetValueEx(
+                _get_run_key(), _AUTOSTART_NAME, 0, winreg.REG_SZ, _autostart_command()
+            )
+            logger.info("Registered Windows autostart.")
+            return True
+        except Exception:
+            logger.exception("Failed to register Windows autostart.")
+            return False
+
+    if IS_MACOS:
+        plist_path = _launchd_plist_path()
+        plist_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            atomic_write_text(plist_path, _launchd_plist_content())
+            logger.info("Created launchd plist at %s", plist_path)
+            return True
+        except Exception:
+            logger.exception("Failed to create launchd plist.")
+            return False
+
+    if IS_LINUX:
+        desktop_path = _desktop_entry_path()
+        desktop_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            atomic_write_text(desktop_path, _desktop_entry_content())
             logger.info("Created autostart desktop entry at %s", desktop_path)
             return True
         except Exception:
@@ -200,12 +343,7 @@ def unregister_autostart() -> bool:
     """Remove Stream Watcher from login items.  Returns True on success."""
     if IS_WINDOWS:
         try:
-            import winreg
-
-            with winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, _AUTOSTART_KEY, 0, winreg.KEY_SET_VALUE
-            ) as key:
-                winreg.DeleteValue(key, _AUTOSTART_NAME)
+            winreg.DeleteValue(_get_run_key(), _AUTOSTART_NAME)
             logger.info("Removed Windows autostart.")
             return True
         except FileNotFoundError:
@@ -215,11 +353,8 @@ def unregister_autostart() -> bool:
             return False
 
     if IS_MACOS:
-        plist_path = (
-            Path.home() / "Library" / "LaunchAgents" / f"{_LAUNCHD_LABEL}.plist"
-        )
         try:
-            plist_path.unlink(missing_ok=True)
+            _launchd_plist_path().unlink(missing_ok=True)
             logger.info("Removed launchd plist.")
             return True
         except Exception:
@@ -227,13 +362,8 @@ def unregister_autostart() -> bool:
             return False
 
     if IS_LINUX:
-        desktop_path = (
-            Path(os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config")))
-            / "autostart"
-            / "stream-watcher.desktop"
-        )
         try:
-            desktop_path.unlink(missing_ok=True)
+            _desktop_entry_path().unlink(missing_ok=True)
             return True
         except Exception:
             logger.exception("Failed to remove autostart desktop entry.")
@@ -24,11 +24,15 @@ import logging
 import signal
 import subprocess
 import sys
-import time
+import threading
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from acb_sync.platform_utils import IS_MACOS, IS_WINDOWS
+from acb_sync.config import Config, get_log_path
+from acb_sync.copier import FileCopier
+from acb_sync.platform_utils import IS_MACOS, IS_WINDOWS, atomic_write_text
+from acb_sync.watcher import FolderWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +56,54 @@ _LAUNCHD_LABEL = "com.acbmedia.streamwatcher"
 _PLIST_DIR = Path.home() / "Library" / "LaunchAgents" if IS_MACOS else Path("/dev/null")
 _PLIST_PATH = _PLIST_DIR / f"{_LAUNCHD_LABEL}.plist" if IS_MACOS else Path("/dev/null")
 
+_PLIST_TEMPLATE = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
+  "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>{label}</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>{exe}</string>
+        <string>-m</string>
+        <string>acb_sync.service</string>
+        <string>run</string>
+    </array>
+    <key>RunAtLoad</key>
+    <false/>
+    <key>KeepAlive</key>
+    <true/>
+    <key>StandardOutPath</key>
+    <string>{stdout}</string>
+    <key>StandardErrorPath</key>
+    <string>{stderr}</string>
+</dict>
+</plist>
+"""
+
+
+def _setup_file_logging() -> None:
+    """Attach a file handler for the log file to the root logger, once.
+
+    Unlike ``logging.basicConfig`` this still works when some other handler
+    is already installed, and never adds the same log file twice.
+    """
+    log_path = str(get_log_path())
+    root = logging.getLogger()
+    if any(
+        isinstance(h, logging.FileHandler) and h.baseFilename == log_path
+        for h in root.handlers
+    ):
+        return
+    handler = logging.FileHandler(log_path, encoding="utf-8")
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    )
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
 
 def _run_sync_loop() -> tuple[Any, Any]:
     """
@@ -59,16 +111,7 @@ def _run_sync_loop() -> tuple[Any, Any]:
 
     Returns the (watcher, copier) so the caller can stop them.
     """
-    from acb_sync.config import Config, get_log_path
-    from acb_sync.copier import FileCopier
-    from acb_sync.watcher import FolderWatcher
-
-    # Set up file logging
-    logging.basicConfig(
-        filename=str(get_log_path()),
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    )
+    _setup_file_logging()
 
     cfg = Config()
     if not cfg.is_configured():
@@ -76,8 +119,8 @@ def _run_sync_loop() -> tuple[Any, Any]:
         raise RuntimeError("Stream Watcher is not configured.")
 
     copier = FileCopier(
-        source_root=cfg.source_folder,
-        destination_root=cfg.destination_folder,
+        source_root=cfg.source_path,
+        destination_root=cfg.destination_path,
         preserve_structure=cfg.copy_subdirectories,
         collision_mode=cfg.collision_mode,
         rename_pattern=cfg.rename_pattern,
@@ -86,9 +129,11 @@ def _run_sync_loop() -> tuple[Any, Any]:
         max_size=cfg.max_file_size,
         retry_count=cfg.retry_count,
         retry_delay=cfg.retry_delay,
+        checksum_algo=cfg.checksum_algo,
+        max_workers=cfg.max_concurrent_copies,
     )
     watcher = FolderWatcher(
-        source_folder=cfg.source_folder,
+        source_folder=cfg.source_path,
         on_file_ready=copier.copy_file,
         stable_seconds=cfg.stable_time,
         extensions=cfg.file_extensions or None,
@@ -144,6 +189,8 @@ if _HAS_WIN32:
             finally:
                 if self._watcher:
                     self._watcher.stop()
+                if self._copier:
+                    self._copier.shutdown(cancel_pending=True)
             logger.info("Service stopped.")
 
 
@@ -154,40 +201,21 @@ if _HAS_WIN32:
 
 def _macos_plist_content() -> str:
     """Generate the launchd plist XML for the current Python environment."""
-    exe = sys.executable
     log_dir = Path.home() / "Library" / "Logs" / "StreamWatcher"
     log_dir.mkdir(parents=True, exist_ok=True)
-    return f"""\
-<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
-  "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{_LAUNCHD_LABEL}</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{exe}</string>
-        <string>-m</string>
-        <string>acb_sync.service</string>
-        <string>run</string>
-    </array>
-    <key>RunAtLoad</key>
-    <false/>
-    <key>KeepAlive</key>
-    <true/>
-    <key>StandardOutPath</key>
-    <string>{log_dir / "stdout.log"}</string>
-    <key>StandardErrorPath</key>
-    <string>{log_dir / "stderr.log"}</string>
-</dict>
-</plist>
-"""
+    return _PLIST_TEMPLATE.format_map(
+        {
+            "label": _LAUNCHD_LABEL,
+            "exe": sys.executable,
+            "stdout": log_dir / "stdout.log",
+            "stderr": log_dir / "stderr.log",
+        }
+    )
 
 
 def _macos_install() -> None:
     _PLIST_DIR.mkdir(parents=True, exist_ok=True)
-    _PLIST_PATH.write_text(_macos_plist_content(), encoding="utf-8")
+    atomic_write_text(_PLIST_PATH, _macos_plist_content())
     print(f"Installed launchd plist: {_PLIST_PATH}")
 
 
@@ -221,20 +249,20 @@ def _macos_remove() -> None:
 
 def _run_foreground() -> None:
     """Run the sync engine in the foreground until SIGINT/SIGTERM."""
-    watcher, _ = _run_sync_loop()
-    stop = False
+    watcher, copier = _run_sync_loop()
+    stop_evt = threading.Event()
 
     def _handler(sig, frame):
-        nonlocal stop
-        stop = True
         watcher.stop()
+        stop_evt.set()
 
     signal.signal(signal.SIGINT, _handler)
     signal.signal(signal.SIGTERM, _handler)
 
     print("Stream Watcher running (press Ctrl-C to stop)\u2026")
-    while not stop:
-        time.sleep(1)
+    # Sleep until a signal arrives — no periodic wake-ups
+    stop_evt.wait()
+    copier.shutdown(cancel_pending=True)
     print("Stream Watcher stopped.")
 
 
@@ -242,6 +270,20 @@ def _run_foreground() -> None:
 # CLI entry
 # ======================================================================
 
+# Sub-commands for ``main()`` on this platform; Windows commands go to
+# pywin32's HandleCommandLine instead.
+_COMMANDS: dict[str, Callable[[], None]] = (
+    {
+        "install": _macos_install,
+        "start": _macos_start,
+        "stop": _macos_stop,
+        "remove": _macos_remove,
+        "run": _run_foreground,
+    }
+    if IS_MACOS
+    else {"start": _run_foreground}
+)
+
 
 def main() -> None:
     """Entry point when this module is run for service/daemon control."""
@@ -264,27 +306,8 @@ def main() -> None:
             win32serviceutil.HandleCommandLine(StreamWatcherService)
         return
 
-    # ---- macOS ----
-    if IS_MACOS:
-        actions = {
-            "install": _macos_install,
-            "start": _macos_start,
-            "stop": _macos_stop,
-            "remove": _macos_remove,
-        }
-        if cmd in actions:
-            actions[cmd]()
-        elif cmd == "run":
-            _run_foreground()
-        else:
-            _show_help()
-        return
-
-    # ---- Linux / other ----
-    if cmd == "start":
-        _run_foreground()
-    else:
-        _show_help()
+    # ---- macOS / Linux ----
+    _COMMANDS.get(cmd, _show_help)()
 
 
 def _show_help() -> None:
@@ -6,14 +6,18 @@ The tooltip dynamically shows the current state and copy count.
 """
 
 import contextlib
+import functools
 import logging
 import threading
-from typing import Protocol, Any
+from collections.abc import Iterable
+from typing import Any, Protocol
 
 import pystray
 from PIL import Image, ImageDraw
 from PIL.Image import Image as PILImage
 
+from acb_sync.platform_utils import IS_MACOS
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,17 +44,14 @@ class TrayCallbacks(Protocol):
         """Quit the application."""
         ...
 
-    def is_sync_enabled(self) -> bool:
-        """Return whether sync is currently active."""
-        ...
-
-    def get_status_summary(self) -> str:
-        """Return a human-readable status string."""
-        ...
-
 
+@functools.lru_cache(maxsize=16)
 def _create_icon_image(color: str = "#0078D4", size: int = 64) -> PILImage:
-    """Create a simple solid-colour square icon with an inner circle indicator."""
+    """Create a simple solid-colour square icon with an inner circle indicator.
+
+    Results are cached per (colour, size) and shared, so callers must not
+    modify the returned image.
+    """
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     # Background rounded-ish square
@@ -71,36 +72,62 @@ def _create_icon_image(color: str = "#0078D4", size: int = 64) -> PILImage:
 class SysTray:
     """Manages the system-tray icon and its context menu.
 
-    The tray runs on its own thread so it does not block the tkinter main loop.
+    The tray never blocks the tkinter main loop: it runs on its own thread,
+    or on macOS shares the AppKit run loop that tk already drives.
     """
 
-    def __init__(self, callbacks: TrayCallbacks):
-        """Create the tray icon bound to *callbacks*."""
+    def __init__(self, callbacks: TrayCallbacks, palette: Iterable[str] = ()):
+        """Create the tray icon bound to *callbacks*.
+
+        *palette* lists the state colours the owner will switch between;
+        their icons are drawn up front in ``start()`` so later colour
+        changes never draw on the caller's thread.
+        """
         self._callbacks = callbacks
+        self._palette = tuple(palette)
+        # (sync enabled, status summary) pushed by the owner via push_status()
+        self._status: tuple[bool, str] = (False, "")
         self._icon: Any | None = None
         self._thread: threading.Thread | None = None
 
     def _build_menu(self) -> pystray.Menu:
-        """Build the context menu with current status."""
-        sync_label = (
-            "Pause Sync" if self._callbacks.is_sync_enabled() else "Resume Sync"
-        )
-        status_text = self._callbacks.get_status_summary()
+        """Build the context menu once.
+
+        Labels that depend on state are callables, which pystray evaluates
+        whenever the menu is shown or updated, so the menu never needs to
+        be rebuilt.  They read the last pushed status snapshot rather than
+        calling back into the app from the tray thread.
+        """
+        cb = self._callbacks
         return pystray.Menu(
-            pystray.MenuItem(f"Stream Watcher — {status_text}", None, enabled=False),
+            pystray.MenuItem(
+                lambda item: f"Stream Watcher — {self._status[1]}",
+                None,
+                enabled=False,
+            ),
             pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Status Window", lambda: self._callbacks.on_open_status()),
-            pystray.MenuItem("Settings", lambda: self._callbacks.on_open_settings()),
+            pystray.MenuItem("Status Window", lambda: cb.on_open_status()),
+            pystray.MenuItem("Settings", lambda: cb.on_open_settings()),
             pystray.Menu.SEPARATOR,
-            pystray.MenuItem(sync_label, lambda: self._callbacks.on_toggle_sync()),
-            pystray.MenuItem("Copy All Now", lambda: self._callbacks.on_copy_now()),
+            pystray.MenuItem(
+                lambda item: "Pause Sync" if self._status[0] else "Resume Sync",
+                lambda: cb.on_toggle_sync(),
+            ),
+            pystray.MenuItem("Copy All Now", lambda: cb.on_copy_now()),
             pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Quit", lambda: self._callbacks.on_quit()),
+            pystray.MenuItem("Quit", lambda: cb.on_quit()),
         )
 
     def start(self) -> None:
-        """Start the tray icon on a daemon thread."""
+        """Start the tray icon.
+
+        On macOS the icon is attached to the AppKit run loop that tk's
+        mainloop already drives (``run_detached``), so no extra thread
+        polls for events.  Elsewhere it runs on a daemon thread.
+        """
         icon_img = _create_icon_image()
+        for color in self._palette:
+            _create_icon_image(color)
         self._icon = pystray.Icon(
             name="StreamWatcher",
             icon=icon_img,
@@ -112,6 +139,10 @@ class SysTray:
         icon = self._icon
         if icon is None:
             return
+        if IS_MACOS and hasattr(icon, "run_detached"):
+            icon.run_detached()
+            logger.info("System tray icon started (detached).")
+            return
         self._thread = threading.Thread(target=icon.run, daemon=True, name="SysTray")
         self._thread.start()
         logger.info("System tray icon started.")
@@ -132,10 +163,16 @@ class SysTray:
     def update_icon_color(self, color: str) -> None:
         """Change the icon colour to reflect state (e.g. green=active, grey=paused)."""
         if self._icon:
-            self._icon.icon = _create_icon_image(color)
-
-    def refresh_menu(self) -> None:
-        """Rebuild the context menu (e.g. after toggling sync)."""
+            img = _create_icon_image(color)
+            # Re-assigning pushes the image to the OS tray; skip if unchanged
+            if self._icon.icon is not img:
+                self._icon.icon = img
+
+    def push_status(self, sync_enabled: bool, summary: str) -> None:
+        """Record the owner's current state and refresh the menu if it changed."""
+        status = (sync_enabled, summary)
+        if status == self._status:
+            return
+        self._status = status
         if self._icon:
-            self._icon.menu = self._build_menu()
             self._icon.update_menu()
@@ -10,12 +10,15 @@ any keyboard shortcut by pressing the keys rather than typing combo strings.
 
 import logging
 import os
+import re
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from typing import TYPE_CHECKING, Any, cast
 from collections.abc import Callable
 
 from acb_sync.config import (
+    CHECKSUM_BLAKE3,
+    CHECKSUM_SHA256,
     COLLISION_OVERWRITE,
     COLLISION_RENAME,
     COLLISION_SKIP,
@@ -24,6 +27,7 @@ from acb_sync.config import (
     get_log_path,
 )
 from acb_sync.platform_utils import (
+    IS_MACOS,
     get_super_modifier_label,
     get_system_font,
     open_file_in_default_app,
@@ -31,6 +35,7 @@ from acb_sync.platform_utils import (
 
 if TYPE_CHECKING:
     from acb_sync.app import App
+    from acb_sync.copier import CopyStats
 
 logger = logging.getLogger(__name__)
 
@@ -59,21 +64,37 @@ _COLLISION_LABELS = {
     COLLISION_SKIP: "Skip (do not copy)",
     COLLISION_OVERWRITE: "Overwrite existing",
 }
-_COLLISION_VALUES = list(_COLLISION_LABELS.keys())
-
-# Modifier key names to normalise
-_MODIFIER_NAMES = {
-    "Control_L",
-    "Control_R",
-    "Shift_L",
-    "Shift_R",
-    "Alt_L",
-    "Alt_R",
-    "Win_L",
-    "Win_R",
-    "Meta_L",
-    "Meta_R",
+_COLLISION_BY_LABEL = {label: mode for mode, label in _COLLISION_LABELS.items()}
+_COLLISION_LABEL_VALUES = tuple(_COLLISION_LABELS.values())
+
+# Shown in a hotkey field while a combo is being recorded
+_RECORDING_PLACEHOLDER = "Press keys\u2026"
+
+# Mouse-wheel events: <MouseWheel> on Windows/macOS, buttons 4/5 on X11
+_WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+# Hotkey names in the Status window hint, in config/update_keys order
+_HINT_NAMES = ("Pause/Resume", "Copy Now", "Status", "Settings", "Quit")
+
+# Separator for the comma-separated filter fields
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
+# Delay (ms) that coalesces bursts of event-driven Status refreshes
+_REFRESH_COALESCE_MS = 50
+
+# Rows kept in the Status window's copy history table
+_HISTORY_ROWS = 200
+# File names in the history table are cut to roughly the column width
+_NAME_CHARS = 30
+
+_CHECKSUM_LABELS = {
+    CHECKSUM_BLAKE3: "BLAKE3 (fast)",
+    CHECKSUM_SHA256: "SHA-256",
 }
+_CHECKSUM_BY_LABEL = {label: algo for algo, label in _CHECKSUM_LABELS.items()}
+_CHECKSUM_LABEL_VALUES = tuple(_CHECKSUM_LABELS.values())
+
+# Tk modifier keysyms -> normalised hotkey modifier names
 _MOD_MAP = {
     "Control_L": "ctrl",
     "Control_R": "ctrl",
@@ -86,49 +107,35 @@ _MOD_MAP = {
     "Meta_L": _SUPER_MOD,
     "Meta_R": _SUPER_MOD,
 }
+# Deterministic modifier order for recorded combos
+_MOD_ORDER = ("ctrl", "alt", "shift", _SUPER_MOD)
+
+
+# Tcl interpreter the ttk styles were last configured for.  Styles are
+# global to an interpreter, so every later window only needs its bg set.
+_themed_tk: Any = None
 
 
 def _apply_theme(root: tk.Tk | tk.Toplevel) -> None:
     """Apply high-contrast, accessible styling to the window and ttk widgets."""
+    global _themed_tk
     root.configure(bg=BG_COLOR)
+    if root.tk is _themed_tk:
+        return
     style = ttk.Style(root)
     style.theme_use("default")
+    label = {"background": BG_COLOR, "foreground": FG_COLOR, "font": (_FONT, 10)}
+    bold = {**label, "font": (_FONT, 10, "bold")}
+    field = {"fieldbackground": FIELD_BG, "foreground": FIELD_FG, "font": (_FONT, 10)}
     style.configure("TFrame", background=BG_COLOR)
+    for name in ("TLabel", "TLabelframe", "Status.TLabel", "TCheckbutton"):
+        style.configure(name, **label)
+    style.configure("TLabelframe.Label", **bold)
+    style.configure("Header.TLabel", **{**label, "font": (_FONT, 13, "bold")})
+    style.configure("Success.TLabel", **{**bold, "foreground": SUCCESS_FG})
+    style.configure("Error.TLabel", **{**bold, "foreground": ERROR_FG})
     style.configure(
-        "TLabel", background=BG_COLOR, foreground=FG_COLOR, font=(_FONT, 10)
-    )
-    style.configure(
-        "TLabelframe", background=BG_COLOR, foreground=FG_COLOR, font=(_FONT, 10)
-    )
-    style.configure(
-        "TLabelframe.Label",
-        background=BG_COLOR,
-        foreground=FG_COLOR,
-        font=(_FONT, 10, "bold"),
-    )
-    style.configure(
-        "Header.TLabel",
-        background=BG_COLOR,
-        foreground=FG_COLOR,
-        font=(_FONT, 13, "bold"),
-    )
-    style.configure(
-        "Status.TLabel", background=BG_COLOR, foreground=FG_COLOR, font=(_FONT, 10)
-    )
-    style.configure(
-        "Success.TLabel",
-        background=BG_COLOR,
-        foreground=SUCCESS_FG,
-        font=(_FONT, 10, "bold"),
-    )
-    style.configure(
-        "Error.TLabel",
-        background=BG_COLOR,
-        foreground=ERROR_FG,
-        font=(_FONT, 10, "bold"),
-    )
-    style.configure(
-        "Hint.TLabel", background=BG_COLOR, foreground=DISABLED_FG, font=(_FONT, 9)
+        "Hint.TLabel", **{**label, "foreground": DISABLED_FG, "font": (_FONT, 9)}
     )
     style.configure(
         "TButton",
@@ -142,20 +149,25 @@ def _apply_theme(root: tk.Tk | tk.Toplevel) -> None:
         background=[("active", "#004080"), ("disabled", DISABLED_BG)],
         foreground=[("disabled", DISABLED_FG)],
     )
-    style.configure(
-        "TEntry", fieldbackground=FIELD_BG, foreground=FIELD_FG, font=(_FONT, 10)
-    )
-    style.configure(
-        "TCheckbutton", background=BG_COLOR, foreground=FG_COLOR, font=(_FONT, 10)
-    )
-    style.configure(
-        "TSpinbox", fieldbackground=FIELD_BG, foreground=FIELD_FG, font=(_FONT, 10)
-    )
-    style.configure(
-        "TCombobox", fieldbackground=FIELD_BG, foreground=FIELD_FG, font=(_FONT, 10)
-    )
+    for name in ("TEntry", "TSpinbox", "TCombobox"):
+        style.configure(name, **field)
     style.configure("Treeview", font=(_FONT, 10), rowheight=24)
     style.configure("Treeview.Heading", font=(_FONT, 10, "bold"))
+    _themed_tk = root.tk
+
+
+def _noop() -> None:
+    pass
+
+
+def _fit(text: str, n: int = _NAME_CHARS) -> str:
+    """Shorten *text* to *n* characters, keeping the end (extension) visible."""
+    return text if len(text) <= n else "\u2026" + text[-(n - 1) :]
+
+
+def _split_csv(text: str) -> list[str]:
+    """Split a comma-separated field into its non-empty, trimmed items."""
+    return [item for item in _CSV_SPLIT.split(text.strip()) if item]
 
 
 def _make_label_entry_row(
@@ -175,13 +187,51 @@ def _make_label_entry_row(
     entry.grid(row=row, column=1, sticky="we", padx=5, pady=6)
 
     if browse:
-        cb = browse_callback if browse_callback is not None else (lambda: None)
+        cb = browse_callback or _noop
         btn = ttk.Button(parent, text="Browse\u2026", command=cb)
         btn.grid(row=row, column=2, sticky="w", padx=(5, 10), pady=6)
 
     return entry
 
 
+def _make_label_field_row(
+    parent: tk.Misc,
+    row: int,
+    label_text: str,
+    variable: tk.Variable,
+    *,
+    width: int = 30,
+    spin_range: tuple[int, int] | None = None,
+    hint: str = "",
+) -> int:
+    """Create a Label + Entry (or Spinbox) row with an optional hint line.
+
+    Returns the next free grid row in *parent*.
+    """
+    ttk.Label(parent, text=label_text).grid(
+        row=row, column=0, sticky="w", padx=(10, 5), pady=6
+    )
+    if spin_range is None:
+        ttk.Entry(parent, textvariable=variable, width=width).grid(
+            row=row, column=1, sticky="we", padx=5, pady=6
+        )
+    else:
+        ttk.Spinbox(
+            parent,
+            from_=spin_range[0],
+            to=spin_range[1],
+            textvariable=variable,
+            width=width,
+        ).grid(row=row, column=1, sticky="w", padx=5, pady=6)
+    row += 1
+    if hint:
+        ttk.Label(parent, text=hint, style="Hint.TLabel").grid(
+            row=row, column=1, sticky="w", padx=5, pady=(0, 4)
+        )
+        row += 1
+    return row
+
+
 # ======================================================================
 # Hotkey recorder widget
 # ======================================================================
@@ -214,11 +264,14 @@ class HotkeyRecorder:
             row=row, column=0, sticky="w", padx=(10, 5), pady=6
         )
 
-        # Display of current value
+        # Display of current value (readonly only blocks typing; the
+        # textvariable still updates it)
         self._display = ttk.Entry(
             parent, textvariable=variable, width=22, state="readonly"
         )
         self._display.grid(row=row, column=1, sticky="w", padx=5, pady=6)
+        # Keys are captured on the toplevel, which never changes for a row
+        self._top = self._display.winfo_toplevel()
 
         btn_frame = ttk.Frame(parent)
         btn_frame.grid(row=row, column=2, sticky="w", padx=(5, 10), pady=6)
@@ -244,42 +297,40 @@ class HotkeyRecorder:
         self._pressed_mods.clear()
         self._pressed_key = ""
         self._rec_btn.configure(text="Stop")
-        self._display.configure(state="normal")
-        self._var.set("Press keys\u2026")
-        self._display.configure(state="readonly")
+        self._var.set(_RECORDING_PLACEHOLDER)
         # Bind to the toplevel window to capture keys even if entry not focused
-        top = self._display.winfo_toplevel()
-        top.bind("<KeyPress>", self._on_key_press)
-        top.bind("<KeyRelease>", self._on_key_release)
+        # add="+" and the returned funcids keep other handlers on the window
+        self._press_id = self._top.bind("<KeyPress>", self._on_key_press, add="+")
+        self._release_id = self._top.bind("<KeyRelease>", self._on_key_release, add="+")
 
     def _stop_recording(self) -> None:
         self._recording = False
         self._rec_btn.configure(text="Record")
-        top = self._display.winfo_toplevel()
-        top.unbind("<KeyPress>")
-        top.unbind("<KeyRelease>")
+        # Removes only our binding (tkinter >= 3.13 honours funcid here)
+        self._top.unbind("<KeyPress>", self._press_id)
+        self._top.unbind("<KeyRelease>", self._release_id)
         # Build the combo string
         combo = self._build_combo()
-        self._display.configure(state="normal")
         self._var.set(combo)
-        self._display.configure(state="readonly")
 
     def _clear(self) -> None:
         if self._recording:
             self._stop_recording()
-        self._display.configure(state="normal")
         self._var.set("")
-        self._display.configure(state="readonly")
+
+    def cancel(self) -> None:
+        """Stop recording, if active, and release the key bindings."""
+        if self._recording:
+            self._stop_recording()
 
     def _on_key_press(self, event: tk.Event) -> str:
         keysym = event.keysym
-        if keysym in _MODIFIER_NAMES:
-            self._pressed_mods.add(_MOD_MAP[keysym])
+        mod = _MOD_MAP.get(keysym)
+        if mod:
+            self._pressed_mods.add(mod)
         elif keysym == "Escape":
             # Cancel recording
-            self._display.configure(state="normal")
             self._var.set("")
-            self._display.configure(state="readonly")
             self._stop_recording()
         else:
             self._pressed_key = keysym.lower()
@@ -291,14 +342,10 @@ class HotkeyRecorder:
         return "break"
 
     def _build_combo(self) -> str:
-        parts: list[str] = []
-        # Deterministic modifier order
-        for mod in ("ctrl", "alt", "shift", _SUPER_MOD):
-            if mod in self._pressed_mods:
-                parts.append(mod)
+        parts = [m for m in _MOD_ORDER if m in self._pressed_mods]
         if self._pressed_key:
             parts.append(self._pressed_key)
-        return "+".join(parts) if parts else ""
+        return "+".join(parts)
 
 
 # ======================================================================
@@ -312,27 +359,78 @@ class SettingsWindow:
     def __init__(self, app: "App"):
         """Create the settings window (hidden until ``show`` is called)."""
         self._app = app
-        self._win: tk.Misc | None = None
+        self._win: tk.Toplevel | None = None
+        self._recorders: list[HotkeyRecorder] = []
 
     def show(self) -> None:
-        """Show or focus the settings window."""
-        if self._win is not None and self._win.winfo_exists():
-            self._win.lift()
-            self._win.focus_force()
-            return
-        self._build()
+        """Show or focus the settings window.
 
-    def _build(self) -> None:
+        The window is built on first use and only hidden when closed, so
+        later openings just reload the form from the current config.
+        """
+        win = self._win
+        if win is None or not win.winfo_exists():
+            win = self._build()
+            # Lay out the whole form once before the window is mapped
+            win.update_idletasks()
+        if win.state() == "withdrawn":
+            self._load_from_config()
+            win.deiconify()
+            win.grab_set()
+            self._bind_wheel()
+        win.lift()
+        win.focus_force()
+
+    def _bind_wheel(self) -> None:
+        for sequence in _WHEEL_EVENTS:
+            self._canvas.bind_all(sequence, self._on_mousewheel)
+
+    def _load_from_config(self) -> None:
+        """Copy the current configuration into the form's variables."""
         cfg = self._app.config
-
+        self._source_var.set(cfg.source_folder)
+        self._dest_var.set(cfg.destination_folder)
+        self._subdirs_var.set(cfg.copy_subdirectories)
+        self._interval_var.set(str(cfg.check_interval))
+        self._stable_var.set(str(cfg.stable_time))
+        self._ext_var.set(", ".join(cfg.file_extensions))
+        self._include_var.set(", ".join(cfg.include_patterns))
+        self._exclude_var.set(", ".join(cfg.exclude_patterns))
+        self._min_size_var.set(str(cfg.min_file_size))
+        self._max_size_var.set(str(cfg.max_file_size))
+        self._collision_var.set(
+            _COLLISION_LABELS.get(
+                cfg.collision_mode, _COLLISION_LABELS[COLLISION_RENAME]
+            )
+        )
+        self._rename_var.set(cfg.rename_pattern)
+        self._verify_var.set(cfg.verify_copies)
+        self._checksum_var.set(
+            _CHECKSUM_LABELS.get(cfg.checksum_algo, _CHECKSUM_LABELS[CHECKSUM_BLAKE3])
+        )
+        self._retry_var.set(str(cfg.retry_count))
+        self._retry_delay_var.set(str(cfg.retry_delay))
+        self._workers_var.set(str(cfg.max_concurrent_copies))
+        self._sound_var.set(cfg.play_sound_on_error)
+        self._hk_pause_var.set(cfg.hotkey_pause_resume)
+        self._hk_copy_var.set(cfg.hotkey_copy_now)
+        self._hk_status_var.set(cfg.hotkey_status)
+        self._hk_settings_var.set(cfg.hotkey_settings)
+        self._hk_quit_var.set(cfg.hotkey_quit)
+        self._minimized_var.set(cfg.start_minimized)
+        self._startup_var.set(cfg.start_with_windows)
+
+    def _build(self) -> tk.Toplevel:
+        """Create the window and its widgets, withdrawn; ``show`` maps it."""
         self._win = tk.Toplevel()
+        # Kept unmapped while populating so geometry is computed only once
+        self._win.withdraw()
         self._win.title("Stream Watcher \u2014 Settings")
         self._win.geometry("720x780")
         self._win.minsize(620, 680)
         self._win.resizable(True, True)
         _apply_theme(self._win)
 
-        self._win.grab_set()
         self._win.protocol("WM_DELETE_WINDOW", self._on_close)
         self._win.bind("<Escape>", lambda e: self._on_close())
 
@@ -347,16 +445,43 @@ class SettingsWindow:
         canvas.create_window((0, 0), window=main, anchor="nw")
         main.columnconfigure(1, weight=1)
 
-        def _on_frame_configure(e):
+        # Resizes send bursts of <Configure>; recompute the region once per burst
+        scroll_job: str | None = None
+
+        def _update_scrollregion():
+            nonlocal scroll_job
+            scroll_job = None
             canvas.configure(scrollregion=canvas.bbox("all"))
 
+        def _on_frame_configure(e):
+            nonlocal scroll_job
+            if scroll_job is not None:
+                canvas.after_cancel(scroll_job)
+            scroll_job = canvas.after(50, _update_scrollregion)
+
         main.bind("<Configure>", _on_frame_configure)
 
-        # Allow mouse-wheel scrolling
+        # Allow mouse-wheel scrolling.  The binding is global, so it is only
+        # held while the window is shown and ignores events from other windows.
+        prefix = f"{self._win}."
+
         def _on_mousewheel(e):
-            canvas.yview_scroll(int(-1 * (e.delta / 120)), "units")
+            if not str(e.widget).startswith(prefix):
+                return
+            if e.num == 4:  # X11 wheel up
+                units = -1
+            elif e.num == 5:  # X11 wheel down
+                units = 1
+            elif IS_MACOS:  # Aqua reports small unscaled deltas
+                units = -e.delta
+            else:
+                # Truncate toward zero so small deltas behave the same
+                # both ways (floor division would round -60 up to a step)
+                units = -int(e.delta / 120)
+            canvas.yview_scroll(units, "units")
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self._canvas = canvas
+        self._on_mousewheel = _on_mousewheel
 
         row = 0
 
@@ -374,7 +499,7 @@ class SettingsWindow:
         folder_frame.columnconfigure(1, weight=1)
         row += 1
 
-        self._source_var = tk.StringVar(value=cfg.source_folder)
+        self._source_var = tk.StringVar()
         _make_label_entry_row(
             folder_frame,
             0,
@@ -384,7 +509,7 @@ class SettingsWindow:
             browse_callback=self._browse_source,
         )
 
-        self._dest_var = tk.StringVar(value=cfg.destination_folder)
+        self._dest_var = tk.StringVar()
         _make_label_entry_row(
             folder_frame,
             1,
@@ -394,7 +519,7 @@ class SettingsWindow:
             browse_callback=self._browse_dest,
         )
 
-        self._subdirs_var = tk.BooleanVar(value=cfg.copy_subdirectories)
+        self._subdirs_var = tk.BooleanVar()
         ttk.Checkbutton(
             folder_frame, text="Include subdirectories", variable=self._subdirs_var
         ).grid(row=2, column=0, columnspan=2, sticky="w", padx=10, pady=4)
@@ -407,21 +532,16 @@ class SettingsWindow:
         timing_frame.columnconfigure(1, weight=1)
         row += 1
 
-        ttk.Label(timing_frame, text="Check interval (seconds):").grid(
-            row=0, column=0, sticky="w", padx=(10, 5), pady=6
-        )
-        self._interval_var = tk.StringVar(value=str(cfg.check_interval))
-        ttk.Spinbox(
-            timing_frame, from_=5, to=3600, textvariable=self._interval_var, width=8
-        ).grid(row=0, column=1, sticky="w", padx=5, pady=6)
-
-        ttk.Label(timing_frame, text="Stable time before copy (seconds):").grid(
-            row=1, column=0, sticky="w", padx=(10, 5), pady=6
-        )
-        self._stable_var = tk.StringVar(value=str(cfg.stable_time))
-        ttk.Spinbox(
-            timing_frame, from_=0, to=3600, textvariable=self._stable_var, width=8
-        ).grid(row=1, column=1, sticky="w", padx=5, pady=6)
+        self._interval_var = tk.StringVar()
+        self._stable_var = tk.StringVar()
+        r = 0
+        for label_text, var, lo in (
+            ("Check interval (seconds):", self._interval_var, 5),
+            ("Stable time before copy (seconds):", self._stable_var, 0),
+        ):
+            r = _make_label_field_row(
+                timing_frame, r, label_text, var, spin_range=(lo, 3600), width=8
+            )
 
         # ============ File Filters & Gating ============
         filter_frame = ttk.LabelFrame(main, text="File Filters", padding=8)
@@ -431,61 +551,60 @@ class SettingsWindow:
         filter_frame.columnconfigure(1, weight=1)
         row += 1
 
-        ttk.Label(
-            filter_frame, text="File extensions (comma-separated, blank=all):"
-        ).grid(row=0, column=0, sticky="w", padx=(10, 5), pady=6)
-        self._ext_var = tk.StringVar(value=", ".join(cfg.file_extensions))
-        ttk.Entry(filter_frame, textvariable=self._ext_var, width=30).grid(
-            row=0, column=1, sticky="we", padx=5, pady=6
-        )
-
-        ttk.Label(
-            filter_frame, text="Include patterns (comma-separated globs, blank=all):"
-        ).grid(row=1, column=0, sticky="w", padx=(10, 5), pady=6)
-        self._include_var = tk.StringVar(value=", ".join(cfg.include_patterns))
-        ttk.Entry(filter_frame, textvariable=self._include_var, width=30).grid(
-            row=1, column=1, sticky="we", padx=5, pady=6
-        )
-        ttk.Label(
-            filter_frame,
-            text="e.g.  ACB_*, *_stream_*.mp4",
-            style="Hint.TLabel",
-        ).grid(row=2, column=1, sticky="w", padx=5, pady=(0, 4))
-
-        ttk.Label(filter_frame, text="Exclude patterns (comma-separated globs):").grid(
-            row=3, column=0, sticky="w", padx=(10, 5), pady=6
-        )
-        self._exclude_var = tk.StringVar(value=", ".join(cfg.exclude_patterns))
-        ttk.Entry(filter_frame, textvariable=self._exclude_var, width=30).grid(
-            row=3, column=1, sticky="we", padx=5, pady=6
-        )
-        ttk.Label(
-            filter_frame, text="e.g.  *.tmp, ~*, thumbs.db", style="Hint.TLabel"
-        ).grid(row=4, column=1, sticky="w", padx=5, pady=(0, 4))
-
-        ttk.Label(filter_frame, text="Minimum file size (bytes, 0=none):").grid(
-            row=5, column=0, sticky="w", padx=(10, 5), pady=6
-        )
-        self._min_size_var = tk.StringVar(value=str(cfg.min_file_size))
-        ttk.Spinbox(
-            filter_frame,
-            from_=0,
-            to=999999999999,
-            textvariable=self._min_size_var,
-            width=14,
-        ).grid(row=5, column=1, sticky="w", padx=5, pady=6)
-
-        ttk.Label(filter_frame, text="Maximum file size (bytes, 0=none):").grid(
-            row=6, column=0, sticky="w", padx=(10, 5), pady=6
-        )
-        self._max_size_var = tk.StringVar(value=str(cfg.max_file_size))
-        ttk.Spinbox(
-            filter_frame,
-            from_=0,
-            to=999999999999,
-            textvariable=self._max_size_var,
-            width=14,
-        ).grid(row=6, column=1, sticky="w", padx=5, pady=6)
+        self._ext_var = tk.StringVar()
+        self._include_var = tk.StringVar()
+        self._exclude_var = tk.StringVar()
+        self._min_size_var = tk.StringVar()
+        self._max_size_var = tk.StringVar()
+        size_range = (0, 999999999999)
+        r = 0
+        # (label, variable, width, spin range, hint)
+        for label_text, var, width, spin_range, hint in (
+            (
+                "File extensions (comma-separated, blank=all):",
+                self._ext_var,
+                30,
+                None,
+                "",
+            ),
+            (
+                "Include patterns (comma-separated globs, blank=all):",
+                self._include_var,
+                30,
+                None,
+                "e.g.  ACB_*, *_stream_*.mp4",
+            ),
+            (
+                "Exclude patterns (comma-separated globs):",
+                self._exclude_var,
+                30,
+                None,
+                "e.g.  *.tmp, ~*, thumbs.db",
+            ),
+            (
+                "Minimum file size (bytes, 0=none):",
+                self._min_size_var,
+                14,
+                size_range,
+                "",
+            ),
+            (
+                "Maximum file size (bytes, 0=none):",
+                self._max_size_var,
+                14,
+                size_range,
+                "",
+            ),
+        ):
+            r = _make_label_field_row(
+                filter_frame,
+                r,
+                label_text,
+                var,
+                width=width,
+                spin_range=spin_range,
+                hint=hint,
+            )
 
         # ============ Collision Protection ============
         col_frame = ttk.LabelFrame(main, text="Collision Protection", padding=8)
@@ -498,14 +617,11 @@ class SettingsWindow:
         ttk.Label(col_frame, text="When destination file exists:").grid(
             row=0, column=0, sticky="w", padx=(10, 5), pady=6
         )
-        current_label = _COLLISION_LABELS.get(
-            cfg.collision_mode, _COLLISION_LABELS[COLLISION_RENAME]
-        )
-        self._collision_var = tk.StringVar(value=current_label)
+        self._collision_var = tk.StringVar()
         combo = ttk.Combobox(
             col_frame,
             textvariable=self._collision_var,
-            values=list(_COLLISION_LABELS.values()),
+            values=_COLLISION_LABEL_VALUES,
             state="readonly",
             width=24,
         )
@@ -514,7 +630,7 @@ class SettingsWindow:
         ttk.Label(col_frame, text="Rename pattern:").grid(
             row=1, column=0, sticky="w", padx=(10, 5), pady=6
         )
-        self._rename_var = tk.StringVar(value=cfg.rename_pattern)
+        self._rename_var = tk.StringVar()
         ttk.Entry(col_frame, textvariable=self._rename_var, width=30).grid(
             row=1, column=1, sticky="we", padx=5, pady=6
         )
@@ -530,28 +646,37 @@ class SettingsWindow:
         ver_frame.columnconfigure(1, weight=1)
         row += 1
 
-        self._verify_var = tk.BooleanVar(value=cfg.verify_copies)
+        self._verify_var = tk.BooleanVar()
         ttk.Checkbutton(
             ver_frame,
-            text="Verify copies with SHA-256 checksum",
+            text="Verify copies with a checksum",
             variable=self._verify_var,
         ).grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=4)
 
-        ttk.Label(ver_frame, text="Retry count on failure:").grid(
+        ttk.Label(ver_frame, text="Checksum algorithm:").grid(
             row=1, column=0, sticky="w", padx=(10, 5), pady=6
         )
-        self._retry_var = tk.StringVar(value=str(cfg.retry_count))
-        ttk.Spinbox(
-            ver_frame, from_=0, to=10, textvariable=self._retry_var, width=6
+        self._checksum_var = tk.StringVar()
+        ttk.Combobox(
+            ver_frame,
+            textvariable=self._checksum_var,
+            values=_CHECKSUM_LABEL_VALUES,
+            state="readonly",
+            width=24,
         ).grid(row=1, column=1, sticky="w", padx=5, pady=6)
 
-        ttk.Label(ver_frame, text="Retry delay (seconds):").grid(
-            row=2, column=0, sticky="w", padx=(10, 5), pady=6
-        )
-        self._retry_delay_var = tk.StringVar(value=str(cfg.retry_delay))
-        ttk.Spinbox(
-            ver_frame, from_=1, to=300, textvariable=self._retry_delay_var, width=6
-        ).grid(row=2, column=1, sticky="w", padx=5, pady=6)
+        self._retry_var = tk.StringVar()
+        self._retry_delay_var = tk.StringVar()
+        self._workers_var = tk.StringVar()
+        r = 2
+        for label_text, var, spin_range in (
+            ("Retry count on failure:", self._retry_var, (0, 10)),
+            ("Retry delay (seconds):", self._retry_delay_var, (1, 300)),
+            ("Simultaneous copies:", self._workers_var, (1, 16)),
+        ):
+            r = _make_label_field_row(
+                ver_frame, r, label_text, var, spin_range=spin_range, width=6
+            )
 
         # ============ Notifications ============
         notif_frame = ttk.LabelFrame(main, text="Notifications", padding=8)
@@ -561,7 +686,7 @@ class SettingsWindow:
         notif_frame.columnconfigure(1, weight=1)
         row += 1
 
-        self._sound_var = tk.BooleanVar(value=cfg.play_sound_on_error)
+        self._sound_var = tk.BooleanVar()
         ttk.Checkbutton(
             notif_frame,
             text="Play system sound on copy failure",
@@ -580,20 +705,18 @@ class SettingsWindow:
         hk_frame.columnconfigure(1, weight=1)
         row += 1
 
-        self._hk_pause_var = tk.StringVar(value=cfg.hotkey_pause_resume)
-        HotkeyRecorder(hk_frame, 0, "Pause / Resume:", self._hk_pause_var)
-
-        self._hk_copy_var = tk.StringVar(value=cfg.hotkey_copy_now)
-        HotkeyRecorder(hk_frame, 1, "Copy Now:", self._hk_copy_var)
-
-        self._hk_status_var = tk.StringVar(value=cfg.hotkey_status)
-        HotkeyRecorder(hk_frame, 2, "Show Status:", self._hk_status_var)
-
-        self._hk_settings_var = tk.StringVar(value=cfg.hotkey_settings)
-        HotkeyRecorder(hk_frame, 3, "Show Settings:", self._hk_settings_var)
-
-        self._hk_quit_var = tk.StringVar(value=cfg.hotkey_quit)
-        HotkeyRecorder(hk_frame, 4, "Quit Application:", self._hk_quit_var)
+        self._hk_pause_var = tk.StringVar()
+        self._hk_copy_var = tk.StringVar()
+        self._hk_status_var = tk.StringVar()
+        self._hk_settings_var = tk.StringVar()
+        self._hk_quit_var = tk.StringVar()
+        self._recorders = [
+            HotkeyRecorder(hk_frame, 0, "Pause / Resume:", self._hk_pause_var),
+            HotkeyRecorder(hk_frame, 1, "Copy Now:", self._hk_copy_var),
+            HotkeyRecorder(hk_frame, 2, "Show Status:", self._hk_status_var),
+            HotkeyRecorder(hk_frame, 3, "Show Settings:", self._hk_settings_var),
+            HotkeyRecorder(hk_frame, 4, "Quit Application:", self._hk_quit_var),
+        ]
 
         # ============ Startup ============
         startup_frame = ttk.LabelFrame(main, text="Startup", padding=8)
@@ -603,12 +726,12 @@ class SettingsWindow:
         startup_frame.columnconfigure(1, weight=1)
         row += 1
 
-        self._minimized_var = tk.BooleanVar(value=cfg.start_minimized)
+        self._minimized_var = tk.BooleanVar()
         ttk.Checkbutton(
             startup_frame, text="Start minimized to tray", variable=self._minimized_var
         ).grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=4)
 
-        self._startup_var = tk.BooleanVar(value=cfg.start_with_windows)
+        self._startup_var = tk.BooleanVar()
         ttk.Checkbutton(
             startup_frame, text="Start at login", variable=self._startup_var
         ).grid(row=1, column=0, columnspan=2, sticky="w", padx=10, pady=4)
@@ -626,8 +749,8 @@ class SettingsWindow:
         )
 
         win = self._win
-        if win:
-            win.after(100, lambda w=win: w.focus_force())
+        win.after(100, lambda w=win: w.focus_force())
+        return win
 
     # ---- browse helpers ----
 
@@ -667,7 +790,9 @@ class SettingsWindow:
                 parent=cast(tk.Misc, self._win),
             )
             return
-        if not os.path.isdir(source):
+        # An unchanged source was already validated when it was saved; skip
+        # the stat, which can block the UI on a slow network share.
+        if source != self._app.config.source_folder and not os.path.isdir(source):
             messagebox.showerror(
                 "Validation Error",
                 f"Source folder does not exist:\n{source}",
@@ -713,26 +838,32 @@ class SettingsWindow:
         try:
             retry_count = int(self._retry_var.get())
             retry_delay = int(self._retry_delay_var.get())
+            max_workers = int(self._workers_var.get())
         except ValueError:
             messagebox.showerror(
                 "Validation Error",
-                "Retry count and delay must be numbers.",
+                "Retry count, delay and simultaneous copies must be numbers.",
                 parent=cast(tk.Misc, self._win),
             )
             return
 
-        # Check for duplicate hotkey assignments
-        hotkeys = {}
-        hk_fields = {
-            "Pause / Resume": self._hk_pause_var.get().strip(),
-            "Copy Now": self._hk_copy_var.get().strip(),
-            "Show Status": self._hk_status_var.get().strip(),
-            "Show Settings": self._hk_settings_var.get().strip(),
-            "Quit": self._hk_quit_var.get().strip(),
-        }
-        for label, key in hk_fields.items():
-            if not key or key == "Press keys\u2026":
+        # Hotkeys — the recorder placeholder counts as unassigned
+        hotkey_values: dict[str, str] = {}
+        hotkeys: dict[str, str] = {}
+        for label, attr, var in (
+            ("Pause / Resume", "hotkey_pause_resume", self._hk_pause_var),
+            ("Copy Now", "hotkey_copy_now", self._hk_copy_var),
+            ("Show Status", "hotkey_status", self._hk_status_var),
+            ("Show Settings", "hotkey_settings", self._hk_settings_var),
+            ("Quit", "hotkey_quit", self._hk_quit_var),
+        ):
+            key = var.get().strip()
+            if key == _RECORDING_PLACEHOLDER:
+                key = ""
+            hotkey_values[attr] = key
+            if not key:
                 continue
+            # Check for duplicate hotkey assignments
             if key in hotkeys:
                 messagebox.showerror(
                     "Validation Error",
@@ -743,68 +874,45 @@ class SettingsWindow:
                 return
             hotkeys[key] = label
 
-        # Resolve collision mode from label back to value
-        collision_label = self._collision_var.get()
-        collision_mode = COLLISION_RENAME
-        for key, label in _COLLISION_LABELS.items():
-            if label == collision_label:
-                collision_mode = key
-                break
-
         cfg = self._app.config
-        cfg.source_folder = source
-        cfg.destination_folder = dest
-        cfg.check_interval = interval
-        cfg.stable_time = stable
-        cfg.file_extensions = [
-            e.strip() for e in self._ext_var.get().split(",") if e.strip()
-        ]
-        cfg.include_patterns = [
-            p.strip() for p in self._include_var.get().split(",") if p.strip()
-        ]
-        cfg.exclude_patterns = [
-            p.strip() for p in self._exclude_var.get().split(",") if p.strip()
-        ]
-        cfg.copy_subdirectories = self._subdirs_var.get()
-        cfg.start_minimized = self._minimized_var.get()
-        cfg.start_with_windows = self._startup_var.get()
-        cfg.collision_mode = collision_mode
-        cfg.rename_pattern = self._rename_var.get().strip() or DEFAULT_RENAME_PATTERN
-        cfg.verify_copies = self._verify_var.get()
-        cfg.min_file_size = min_size
-        cfg.max_file_size = max_size
-        cfg.retry_count = retry_count
-        cfg.retry_delay = retry_delay
-        cfg.play_sound_on_error = self._sound_var.get()
-        # Hotkeys — normalise "Press keys…" placeholder to empty
-        cfg.hotkey_pause_resume = (
-            ""
-            if self._hk_pause_var.get() == "Press keys\u2026"
-            else self._hk_pause_var.get()
-        )
-        cfg.hotkey_copy_now = (
-            ""
-            if self._hk_copy_var.get() == "Press keys\u2026"
-            else self._hk_copy_var.get()
-        )
-        cfg.hotkey_status = (
-            ""
-            if self._hk_status_var.get() == "Press keys\u2026"
-            else self._hk_status_var.get()
-        )
-        cfg.hotkey_settings = (
-            ""
-            if self._hk_settings_var.get() == "Press keys\u2026"
-            else self._hk_settings_var.get()
-        )
-        cfg.hotkey_quit = (
-            ""
-            if self._hk_quit_var.get() == "Press keys\u2026"
-            else self._hk_quit_var.get()
-        )
-        cfg.save()
+        values: dict[str, Any] = {
+            "source_folder": source,
+            "destination_folder": dest,
+            "check_interval": interval,
+            "stable_time": stable,
+            "file_extensions": _split_csv(self._ext_var.get()),
+            "include_patterns": _split_csv(self._include_var.get()),
+            "exclude_patterns": _split_csv(self._exclude_var.get()),
+            "copy_subdirectories": self._subdirs_var.get(),
+            "start_minimized": self._minimized_var.get(),
+            "start_with_windows": self._startup_var.get(),
+            # Map combobox labels back to their config values
+            "collision_mode": _COLLISION_BY_LABEL.get(
+                self._collision_var.get(), COLLISION_RENAME
+            ),
+            "rename_pattern": self._rename_var.get().strip() or DEFAULT_RENAME_PATTERN,
+            "verify_copies": self._verify_var.get(),
+            "checksum_algo": _CHECKSUM_BY_LABEL.get(
+                self._checksum_var.get(), cfg.checksum_algo
+            ),
+            "min_file_size": min_size,
+            "max_file_size": max_size,
+            "retry_count": retry_count,
+            "retry_delay": retry_delay,
+            "max_concurrent_copies": max_workers,
+            "play_sound_on_error": self._sound_var.get(),
+            **hotkey_values,
+        }
+        changed = [k for k, v in values.items() if getattr(cfg, k) != v]
+        if not changed:
+            # Nothing edited: leave the config file and running sync alone
+            self._on_close()
+            return
+        for attr in changed:
+            setattr(cfg, attr, values[attr])
 
-        # Restart the watcher with new settings
+        # Restart the watcher with new settings; this also schedules the
+        # config write on the debounced background flush, off the Tk thread
         self._app.restart_sync()
 
         messagebox.showinfo(
@@ -815,16 +923,14 @@ class SettingsWindow:
         self._on_close()
 
     def _on_close(self) -> None:
+        # Hide rather than destroy; show() reloads the form next time
         if self._win:
-            # Unbind mousewheel to avoid errors after window closed
-            try:
-                canvas_widget = self._win.winfo_children()[1]  # canvas
-                canvas_widget.unbind_all("<MouseWheel>")
-            except Exception:
-                pass
+            for recorder in self._recorders:
+                recorder.cancel()
+            for sequence in _WHEEL_EVENTS:
+                self._canvas.unbind_all(sequence)
             self._win.grab_release()
-            self._win.destroy()
-            self._win = None
+            self._win.withdraw()
 
 
 # ======================================================================
@@ -844,6 +950,17 @@ class StatusWindow:
         self._detail_text: tk.Text | None = None
         self._tree: ttk.Treeview | None = None
         self._update_job: str | None = None
+        # Pending out-of-band refresh requested by copy activity
+        self._refresh_job: str | None = None
+        # Stats object and revision the history table currently reflects
+        self._history_stats: CopyStats | None = None
+        self._history_rev = 0
+        # Inputs behind the last refresh, to skip unchanged ticks
+        self._last_sig: tuple[Any, ...] | None = None
+        # What the status line, sync button and stats line currently show
+        self._last_state: tuple[bool, bool] | None = None
+        self._last_stats_text: str | None = None
+        self._last_hint_key: tuple[str, ...] | None = None
 
     def show(self) -> None:
         """Show or focus the status window."""
@@ -863,6 +980,10 @@ class StatusWindow:
 
         self._win.protocol("WM_DELETE_WINDOW", self._on_close)
         self._win.bind("<Escape>", lambda e: self._on_close())
+        # Stop the refresh timer while minimised; <Map>/<Unmap> also fire
+        # for every child widget, so only react to the toplevel itself.
+        self._win.bind("<Unmap>", self._on_unmap)
+        self._win.bind("<Map>", self._on_map)
 
         main = ttk.Frame(self._win, padding=10)
         main.pack(fill="both", expand=True)
@@ -885,6 +1006,7 @@ class StatusWindow:
 
         # ---- Hotkey hint ----
         self._hint_label = ttk.Label(main, text="", style="Hint.TLabel")
+        self._last_hint_key = None
         self._hint_label.grid(row=3, column=0, sticky="w", padx=10, pady=(2, 6))
         self._update_hint()
 
@@ -899,6 +1021,10 @@ class StatusWindow:
         tree_frame.rowconfigure(0, weight=1)
         main.rowconfigure(5, weight=1)
 
+        self._history_stats = None
+        self._last_sig = None
+        self._last_state = None
+        self._last_stats_text = None
         columns = ("time", "status", "source", "destination", "size", "verified")
         self._tree = ttk.Treeview(
             tree_frame,
@@ -964,23 +1090,64 @@ class StatusWindow:
 
     def _schedule_update(self) -> None:
         if self._win and self._win.winfo_exists():
-            self._refresh()
+            # Nothing to repaint while minimised or otherwise unmapped
+            if self._win.winfo_viewable():
+                self._refresh()
             self._update_job = self._win.after(2000, self._schedule_update)
 
+    def request_refresh(self) -> None:
+        """Refresh shortly instead of waiting for the next 2-second tick.
+
+        Must be called on the tk thread.  Requests arriving within
+        ``_REFRESH_COALESCE_MS`` of each other share one refresh.
+        """
+        if self._win is None or self._refresh_job is not None:
+            return
+        self._refresh_job = self._win.after(
+            _REFRESH_COALESCE_MS, self._run_requested_refresh
+        )
+
+    def _run_requested_refresh(self) -> None:
+        self._refresh_job = None
+        if self._win and self._win.winfo_viewable():
+            self._refresh()
+
+    def _cancel_updates(self) -> None:
+        for job in (self._update_job, self._refresh_job):
+            if job is not None and self._win:
+                self._win.after_cancel(job)
+        self._update_job = None
+        self._refresh_job = None
+
+    def _on_unmap(self, event: tk.Event) -> None:
+        if event.widget is self._win:
+            self._cancel_updates()
+
+    def _on_map(self, event: tk.Event) -> None:
+        if event.widget is self._win and self._update_job is None:
+            self._schedule_update()
+
     def _update_hint(self) -> None:
-        """Build and display the hotkey hint line from current config."""
+        """Build and display the hotkey hint line from current config.
+
+        Skipped when the hotkeys are the same as last time.
+        """
         cfg = self._app.config
-        parts: list[str] = []
-        if cfg.hotkey_pause_resume:
-            parts.append(f"Pause/Resume = {cfg.hotkey_pause_resume}")
-        if cfg.hotkey_copy_now:
-            parts.append(f"Copy Now = {cfg.hotkey_copy_now}")
-        if cfg.hotkey_status:
-            parts.append(f"Status = {cfg.hotkey_status}")
-        if cfg.hotkey_settings:
-            parts.append(f"Settings = {cfg.hotkey_settings}")
-        if cfg.hotkey_quit:
-            parts.append(f"Quit = {cfg.hotkey_quit}")
+        key = (
+            cfg.hotkey_pause_resume,
+            cfg.hotkey_copy_now,
+            cfg.hotkey_status,
+            cfg.hotkey_settings,
+            cfg.hotkey_quit,
+        )
+        if key == self._last_hint_key:
+            return
+        self._last_hint_key = key
+        parts = [
+            f"{name} = {combo}"
+            for name, combo in zip(_HINT_NAMES, key, strict=True)
+            if combo
+        ]
         text = "Hotkeys:  " + "  |  ".join(parts) if parts else "No hotkeys configured."
         if self._hint_label:
             self._hint_label.configure(text=text)
@@ -992,27 +1159,32 @@ class StatusWindow:
         cfg = self._app.config
         enabled = cfg.sync_enabled
         configured = cfg.is_configured()
+        copier = self._app.copier
+        watcher = self._app.watcher
 
-        # Status text
-        if not configured:
-            status = (
-                "Not configured \u2014 open Settings"
-                " to set source and destination folders."
-            )
-            style = "Error.TLabel"
-        elif enabled:
-            status = "Sync is ACTIVE \u2014 watching for new files."
-            style = "Success.TLabel"
-        else:
-            status = "Sync is PAUSED."
-            style = "Status.TLabel"
+        # Hotkeys can change in Settings while this window is open
+        self._update_hint()
 
-        if self._status_label:
-            self._status_label.configure(text=status, style=style)
+        # Skip all widget updates if nothing shown here has changed
+        sig = (
+            enabled,
+            configured,
+            id(copier),
+            copier.stats.revision if copier else 0,
+            copier.active_copies if copier else 0,
+            watcher.pending_count if watcher else 0,
+        )
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        # Status text and sync button only follow the enabled/configured
+        # state, so copy activity alone leaves them untouched
+        if (enabled, configured) != self._last_state:
+            self._last_state = (enabled, configured)
+            self._update_state_widgets(enabled, configured)
 
         # Stats
-        copier = self._app.copier
-        watcher = self._app.watcher
         parts: list[str] = []
         if copier:
             s = copier.stats
@@ -1030,29 +1202,54 @@ class StatusWindow:
             if pending:
                 parts.append(f"Stabilising: {pending}")
 
-        if self._stats_label:
-            self._stats_label.configure(
-                text=" | ".join(parts) if parts else "No stats yet."
+        stats_text = " | ".join(parts) if parts else "No stats yet."
+        if self._stats_label and stats_text != self._last_stats_text:
+            self._last_stats_text = stats_text
+            self._stats_label.configure(text=stats_text)
+
+        # History table
+        self._update_history()
+
+    def _update_state_widgets(self, enabled: bool, configured: bool) -> None:
+        if not configured:
+            status = (
+                "Not configured \u2014 open Settings"
+                " to set source and destination folders."
             )
+            style = "Error.TLabel"
+        elif enabled:
+            status = "Sync is ACTIVE \u2014 watching for new files."
+            style = "Success.TLabel"
+        else:
+            status = "Sync is PAUSED."
+            style = "Status.TLabel"
+
+        if self._status_label:
+            self._status_label.configure(text=status, style=style)
 
         # Sync button label
         if self._sync_btn:
             self._sync_btn.configure(text="Pause Sync" if enabled else "Resume Sync")
 
-        # History table
-        self._update_history()
-
     def _update_history(self) -> None:
         copier = self._app.copier
         if not copier or not self._tree:
             return
 
-        # Clear existing
-        for item in self._tree.get_children():
-            self._tree.delete(item)
+        stats = copier.stats
+        if stats is not self._history_stats:
+            # New copier (sync restarted): start the table over
+            self._tree.delete(*self._tree.get_children())
+            self._history_stats = stats
+            self._history_rev = 0
+
+        # Only records added since the last tick are inserted
+        rev, new = stats.records_since(self._history_rev, _HISTORY_ROWS)
+        self._history_rev = rev
+        if not new:
+            return
 
-        # Insert most recent first
-        for rec in reversed(copier.stats.history[-200:]):
+        for rec in new:
             if rec.skipped:
                 st = "Skip"
             elif rec.success:
@@ -1060,21 +1257,28 @@ class StatusWindow:
             else:
                 st = "FAIL"
 
-            src_name = os.path.basename(rec.source)
-            dst_name = os.path.basename(rec.destination) if rec.destination else ""
-            size_str = f"{rec.size_bytes:,}" if rec.size_bytes else ""
+            src_name = _fit(os.path.basename(rec.source))
+            dst_name = (
+                _fit(os.path.basename(rec.destination)) if rec.destination else ""
+            )
+            size_str = format(rec.size_bytes, ",d") if rec.size_bytes else ""
             ver = (
                 "Yes"
                 if rec.verified
                 else ("N/A" if rec.skipped else ("No" if rec.success else ""))
             )
 
+            # Most recent first
             self._tree.insert(
                 "",
-                "end",
+                0,
                 values=(rec.timestamp_str, st, src_name, dst_name, size_str, ver),
             )
 
+        rows = self._tree.get_children()
+        if len(rows) > _HISTORY_ROWS:
+            self._tree.delete(*rows[_HISTORY_ROWS:])
+
     # ---- actions ----
 
     def _toggle_sync(self) -> None:
@@ -1095,8 +1299,7 @@ class StatusWindow:
             )
 
     def _on_close(self) -> None:
-        if self._update_job and self._win:
-            self._win.after_cancel(self._update_job)
+        self._cancel_updates()
         if self._win:
             self._win.destroy()
             self._win = None
@@ -6,20 +6,32 @@ modified files, then queues them for stability checking and copying.
 
 from __future__ import annotations
 
-import fnmatch
+import copy
 import logging
 import os
+import stat
 import threading
 import time
 from collections.abc import Callable
-from typing import Dict, Tuple, Any
 from pathlib import Path
+from typing import Any
 
 from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from acb_sync.filters import FileFilter, normalise_extensions
+
 logger = logging.getLogger(__name__)
 
+# Shortest pause between stability passes, so a zero threshold cannot spin
+_MIN_WAIT = 0.5
+
+# Repeat events for one path within this many seconds are dropped; the
+# stability pass re-stats the file anyway
+_EVENT_DEDUP_WINDOW = 0.25
+# Prune the recent-event table once it grows past this many paths
+_EVENT_DEDUP_MAX = 512
+
 
 class _StabilityTracker:
     """Tracks files until they have been stable (unchanged) for a given duration."""
@@ -27,11 +39,14 @@ class _StabilityTracker:
     def __init__(self, stable_seconds: int, on_stable: Callable[[Path], None]):
         self._stable_seconds = stable_seconds
         self._on_stable = on_stable
-        # file_path -> (last_modified_time, last_size)
+        # file_path -> (last_seen monotonic time, last_size)
         # Use simple assignment to avoid pyright type-expression quirks
         self._pending = {}
         self._lock = threading.Lock()
-        self._stop = threading.Event()
+        # Wakes the poll thread on stop, on the first file after an idle
+        # spell, and when the threshold changes
+        self._cond = threading.Condition(self._lock)
+        self._stopping = False
         self._thread = threading.Thread(
             target=self._poll, daemon=True, name="StabilityTracker"
         )
@@ -42,69 +57,111 @@ class _StabilityTracker:
 
     @stable_seconds.setter
     def stable_seconds(self, value: int) -> None:
-        self._stable_seconds = max(0, value)
+        with self._cond:
+            self._stable_seconds = max(0, value)
+            self._cond.notify()
 
     def start(self) -> None:
-        self._stop.clear()
+        self._stopping = False
         self._thread = threading.Thread(
             target=self._poll, daemon=True, name="StabilityTracker"
         )
         self._thread.start()
 
     def stop(self) -> None:
-        self._stop.set()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
 
-    def track(self, path: Path) -> None:
-        """Register or update a file for stability tracking."""
-        if not path.is_file():
-            return
+    def track(self, path: str, now: float | None = None) -> None:
+        """Register or update a file for stability tracking.
+
+        Paths stay plain strings until the file is reported stable.  *now*
+        is the event's ``time.monotonic()`` reading, if the caller has one.
+        """
+        # One stat both filters out non-files and gives the size
         try:
-            stat = path.stat()
+            st = os.stat(path)
         except OSError:
             return
-        with self._lock:
-            self._pending[path] = (time.time(), stat.st_size)
-        logger.debug("Tracking %s (size=%d)", path, stat.st_size)
+        if not stat.S_ISREG(st.st_mode):
+            return
+        with self._cond:
+            if not self._pending:
+                self._cond.notify()
+            seen = time.monotonic() if now is None else now
+            self._pending[path] = (seen, st.st_size)
+        logger.debug("Tracking %s (size=%d)", path, st.st_size)
 
     @property
     def pending_count(self) -> int:
-        with self._lock:
-            return len(self._pending)
+        # len() of a dict is atomic; no need to queue behind the poll thread
+        return len(self._pending)
 
     @property
     def pending_files(self) -> list[str]:
         with self._lock:
-            return [str(p) for p in self._pending]
+            return list(self._pending)
 
     def _poll(self) -> None:
-        """Periodically check if tracked files have stabilised."""
-        while not self._stop.is_set():
-            stable = []  # type: list[Path]
-            now = time.time()
-            with self._lock:
-                for path, (last_seen, last_size) in list(self._pending.items()):
-                    try:
-                        current_size = path.stat().st_size
-                    except OSError:
+        """Check tracked files when the next one is due to stabilise.
+
+        The thread sleeps indefinitely while nothing is tracked.  A new
+        file is always due no earlier than the ones already waiting, so
+        ``track`` only needs to wake it when the table was empty.
+        """
+        while True:
+            stable = []  # type: list[str]
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                snapshot = list(self._pending.items())
+                threshold = self._stable_seconds
+
+            # Stat outside the lock, so a slow share never stalls track()
+            now = time.monotonic()
+            sizes = {}  # type: dict[str, int | None]
+            for path, _entry in snapshot:
+                try:
+                    sizes[path] = os.stat(path).st_size
+                except OSError:
+                    sizes[path] = None
+
+            next_due = now + threshold
+            with self._cond:
+                for path, entry in snapshot:
+                    if self._pending.get(path) is not entry:
+                        # Re-tracked meanwhile; the newer entry wins
+                        continue
+                    last_seen, last_size = entry
+                    current_size = sizes[path]
+                    if current_size is None:
                         # File vanished — drop it
                         del self._pending[path]
                         continue
                     if current_size != last_size:
                         # Still changing — update
                         self._pending[path] = (now, current_size)
-                    elif now - last_seen >= self._stable_seconds:
+                    elif now - last_seen >= threshold:
                         stable.append(path)
+                        continue
+                    else:
+                        next_due = min(next_due, last_seen + threshold)
                 for p in stable:
                     del self._pending[p]
 
             for p in stable:
                 logger.info("File stable: %s", p)
                 try:
-                    self._on_stable(p)
+                    self._on_stable(Path(p))
                 except Exception:
                     logger.exception("Error in on_stable callback for %s", p)
 
-            self._stop.wait(timeout=5)
+            with self._cond:
+                if self._pending and not self._stopping:
+                    self._cond.wait(timeout=max(_MIN_WAIT, next_due - time.monotonic()))
 
 
 class NewFileHandler(FileSystemEventHandler):
@@ -116,51 +173,50 @@ class NewFileHandler(FileSystemEventHandler):
         extensions: list[str] | None = None,
         include_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
+        file_filter: FileFilter | None = None,
     ):
-        """Initialise the handler with optional filters."""
+        """Initialise the handler with optional filters.
+
+        A pre-built *file_filter* takes precedence over the raw extension
+        and glob lists.
+        """
         super().__init__()
         self._tracker = tracker
-        self._extensions = extensions  # None or empty = accept all
-        self._include_patterns = include_patterns or []
-        self._exclude_patterns = exclude_patterns or []
+        self._filter = file_filter or FileFilter(
+            extensions, include_patterns, exclude_patterns
+        )
+        # path -> monotonic time it was last passed to the tracker.  Only
+        # the observer thread touches this, so it needs no lock.
+        self._recent: dict[str, float] = {}
 
     def _should_track(self, path: str) -> bool:
-        name = os.path.basename(path)
-        # Check include patterns first — file must match at least one
-        if self._include_patterns:
-            matched = any(
-                fnmatch.fnmatch(name.lower(), p.lower()) for p in self._include_patterns
-            )
-            if not matched:
-                logger.debug(
-                    "Ignoring %s (does not match any include pattern)",
-                    name,
-                )
-                return False
-        # Check exclude patterns (glob-style)
-        for pattern in self._exclude_patterns:
-            if fnmatch.fnmatch(name.lower(), pattern.lower()):
-                logger.debug("Excluding %s (matches %s)", name, pattern)
-                return False
-        # Check allowed extensions
-        if not self._extensions:
-            return True
-        ext = os.path.splitext(path)[1].lower().lstrip(".")
-        return ext in self._extensions
+        return self._filter.matches(os.path.basename(path))
+
+    def _on_file_event(self, path: str) -> None:
+        now = time.monotonic()
+        recent = self._recent
+        if now - recent.get(path, -_EVENT_DEDUP_WINDOW) < _EVENT_DEDUP_WINDOW:
+            return
+        if not self._should_track(path):
+            return
+        if len(recent) > _EVENT_DEDUP_MAX:
+            self._recent = recent = {
+                p: t for p, t in recent.items() if now - t < _EVENT_DEDUP_WINDOW
+            }
+        recent[path] = now
+        self._tracker.track(path, now)
 
     def on_created(self, event: FileCreatedEvent) -> None:  # type: ignore[override]
         """Handle a new file creation event."""
         if event.is_directory:
             return
-        if self._should_track(event.src_path):
-            self._tracker.track(Path(event.src_path))
+        self._on_file_event(event.src_path)
 
     def on_modified(self, event: FileModifiedEvent) -> None:  # type: ignore[override]
         """Handle a file modification event."""
         if event.is_directory:
             return
-        if self._should_track(event.src_path):
-            self._tracker.track(Path(event.src_path))
+        self._on_file_event(event.src_path)
 
 
 class FolderWatcher:
@@ -175,16 +231,17 @@ class FolderWatcher:
 
     def __init__(
         self,
-        source_folder: str,
+        source_folder: str | os.PathLike[str],
         on_file_ready: Callable[[Path], None],
         stable_seconds: int = 60,
         extensions: list[str] | None = None,
         include_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
         recursive: bool = False,
+        file_filter: FileFilter | None = None,
     ):
         """Create a new folder watcher."""
-        self.source_folder = source_folder
+        self.source_folder = os.fspath(source_folder)
         self._recursive = recursive
         self._tracker = _StabilityTracker(stable_seconds, on_file_ready)
         self._handler = NewFileHandler(
@@ -192,6 +249,7 @@ class FolderWatcher:
             extensions or None,
             include_patterns or None,
             exclude_patterns or None,
+            file_filter=file_filter,
         )
         self._observer: Any | None = None
 
@@ -238,8 +296,23 @@ class FolderWatcher:
         self._tracker.stable_seconds = seconds
 
     def update_extensions(self, extensions: list[str]) -> None:
-        """Hot-update the allowed file extensions."""
-        self._handler._extensions = extensions or None
+        """Hot-update the allowed file extensions.
+
+        The filter is shared with the copier, so a modified copy is swapped
+        in rather than changing it in place.
+        """
+        file_filter = copy.copy(self._handler._filter)
+        file_filter.extensions = normalise_extensions(extensions)
+        self._handler._filter = file_filter
+
+    def reconfigure(self, *, stable_seconds: int, file_filter: FileFilter) -> None:
+        """Hot-update the stability threshold and all file filters.
+
+        The observer keeps running, so no events are missed while the new
+        settings are applied.
+        """
+        self._tracker.stable_seconds = stable_seconds
+        self._handler._filter = file_filter
 
     # ---- status ----
 
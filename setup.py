@@ -22,6 +22,10 @@ setup(
             "pywin32>=306",
             "accessible_output2>=0.17",
         ],
+        "speedups": [
+            "orjson>=3.9",
+            "blake3>=0.4",
+        ],
     },
     entry_points={
         "console_scripts": [